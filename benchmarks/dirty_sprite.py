@@ -0,0 +1,49 @@
+"""Times pixelsShow() for a 4x4 sprite moving over a 32x32 wall.
+
+The wall is 16 matrix8x8 tiles. Each frame erases the sprite, moves it
+one pixel and redraws it. The frame is shown with full uploads, then
+with dirtyTracking, so only the changed LEDs are rescaled and
+re-uploaded. Run it from the repository root:
+
+    python benchmarks/dirty_sprite.py
+
+Without rpi_ws281x installed, run it against the recording stub:
+
+    PYTHONPATH=tests python benchmarks/dirty_sprite.py
+
+On a Raspberry Pi Pico copy glowbit.py and this script to the board and
+run the script there.
+"""
+
+import sys
+import time
+
+try:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+except (ImportError, AttributeError):
+    pass
+
+import glowbit
+
+try:
+    perf_counter = time.perf_counter
+except AttributeError:
+    def perf_counter():
+        return time.ticks_us() / 1000000
+
+FRAMES = 2000
+
+for dirty in (False, True):
+    m = glowbit.matrix8x8(tileRows = 4, tileCols = 4, rateLimitFPS = 100000)
+    m.dirtyTracking = dirty
+    shown = 0
+    x = 0
+    for _ in range(FRAMES):
+        m.drawRectangleFill(x % 29, 10, x % 29 + 3, 13, 0)
+        x += 1
+        m.drawRectangleFill(x % 29, 10, x % 29 + 3, 13, 0xFF8000)
+        start = perf_counter()
+        m.pixelsShow()
+        shown += perf_counter() - start
+    print("32x32 sprite, dirtyTracking=%s: pixelsShow %.1f us/frame" % (dirty, shown / FRAMES * 1000000))
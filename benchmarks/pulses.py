@@ -0,0 +1,49 @@
+"""Times stick.updatePulses() with many simultaneous pulses.
+
+Keeps PULSES three-pixel pulses, two of whose pixels use the "Rainbow"
+colour map, on a stick of LEDS LEDs at random positions and speeds.
+Pulses which leave the stick are replaced. Nothing is shown on the
+physical LEDs. Run it from the repository root:
+
+    python benchmarks/pulses.py
+
+Without rpi_ws281x installed, run it against the recording stub:
+
+    PYTHONPATH=tests python benchmarks/pulses.py
+
+On a Raspberry Pi Pico copy glowbit.py and this script to the board,
+lower LEDS and PULSES to fit its memory, and run the script there.
+"""
+
+import random
+import sys
+import time
+
+try:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+except (ImportError, AttributeError):
+    pass
+
+import glowbit
+
+try:
+    perf_counter = time.perf_counter
+except AttributeError:
+    def perf_counter():
+        return time.ticks_us() / 1000000
+
+LEDS = 2400
+PULSES = 1000
+FRAMES = 100
+
+s = glowbit.stick(numLEDs = LEDS, rateLimitFPS = 100000)
+elapsed = 0
+for _ in range(FRAMES):
+    while len(s.pulses) < PULSES:
+        s.addPulse(speed = random.choice([50, 100, -100, -200]), index = random.randrange(LEDS), colourMap = "Rainbow", colour = [-1, 0x202020, -1])
+    s.pixelsFill(0)
+    start = perf_counter()
+    s.updatePulses()
+    elapsed += perf_counter() - start
+print("%d pulses on %d LEDs: updatePulses %.3f ms/frame" % (PULSES, LEDS, elapsed / FRAMES * 1000))
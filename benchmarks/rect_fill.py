@@ -0,0 +1,64 @@
+"""Times drawRectangleFill() and drawRectangleFillAdd() over a whole display.
+
+Covers an 8x8 matrix, a 2x2 tiled 16x16 wall and a 1x8 tiled 64x8
+wall. The nested pixelSetXY()/pixelAddXY() loops which the two methods
+used before drawing spans are timed as the reference. Run it from the
+repository root:
+
+    python benchmarks/rect_fill.py
+
+Without rpi_ws281x installed, run it against the recording stub:
+
+    PYTHONPATH=tests python benchmarks/rect_fill.py
+
+On a Raspberry Pi Pico copy glowbit.py and this script to the board and
+run the script there.
+"""
+
+import sys
+import time
+
+try:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+except (ImportError, AttributeError):
+    pass
+
+import glowbit
+
+try:
+    perf_counter = time.perf_counter
+except AttributeError:
+    def perf_counter():
+        return time.ticks_us() / 1000000
+
+REPS = 200
+
+
+# The previous drawRectangleFill() and drawRectangleFillAdd() bodies
+def fillPerPixel(m, x0, y0, x1, y1, colour):
+    for x in range(x0, x1+1):
+        for y in range(y0, y1+1):
+            m.pixelSetXY(x,y,colour)
+
+def fillAddPerPixel(m, x0, y0, x1, y1, colour):
+    for x in range(x0, x1+1):
+        for y in range(y0, y1+1):
+            m.pixelAddXY(x,y,colour)
+
+def timed(fill, W, H):
+    start = perf_counter()
+    for _ in range(REPS):
+        fill(0, 0, W - 1, H - 1, 0)
+    return (perf_counter() - start) / REPS * 1000000
+
+for name, tileRows, tileCols in (("8x8", 1, 1), ("16x16", 2, 2), ("64x8", 1, 8)):
+    m = glowbit.matrix8x8(tileRows = tileRows, tileCols = tileCols)
+    W = m.numLEDsX
+    H = m.numLEDsY
+    results = []
+    for (method, reference) in (("drawRectangleFill", fillPerPixel), ("drawRectangleFillAdd", fillAddPerPixel)):
+        before = timed(lambda *args: reference(m, *args), W, H)
+        after = timed(getattr(m, method), W, H)
+        results.append("%s %.1f -> %.1f us (%.1fx)" % (method, before, after, before / after))
+    print(name, " | ".join(results))
@@ -0,0 +1,52 @@
+"""Times stick.pixelsShow() on the Raspberry Pi for several strip lengths.
+
+Each frame is scaled by the brightness lookup table and written to the
+strip. The frame rate limit is set far above what can be reached, so
+only the frame path is timed. The per-pixel loop which pixelsShow() used
+before the lookup table, scaling each LED in Python and writing it with
+setPixelColor(), is timed on the same frame as the reference. Run it
+from the repository root:
+
+    python benchmarks/show_brightness.py
+
+Without rpi_ws281x installed, run it against the recording stub:
+
+    PYTHONPATH=tests python benchmarks/show_brightness.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+
+import glowbit
+
+
+# The previous pixelsShow() body, without its frame rate wait
+def perPixelShow(s):
+    br = s.brightness
+    for i,c in enumerate(s.ar):
+        r = int((((int(c) >> 16) & 0xFF) * br) >> 8)
+        g = int((((int(c) >> 8) & 0xFF) * br) >> 8)
+        b = int(((int(c) & 0xFF) * br) >> 8)
+        s.strip.setPixelColor(i, (r<<16) | (g<<8) | b)
+    s.strip.show()
+
+def timed(show, reps):
+    start = time.perf_counter()
+    for _ in range(reps):
+        show()
+    return (time.perf_counter() - start) / reps * 1000
+
+for n in (64, 1024, 16384):
+    s = glowbit.stick(numLEDs = n, brightness = 77, rateLimitFPS = 100000)
+    for i in range(n):
+        s.ar[i] = random.randint(0, 0xFFFFFF)
+    s.skipUnchangedFrames = False
+    s.pixelsShow()
+    reps = max(3, 20000 // n)
+    before = timed(lambda: perPixelShow(s), reps)
+    after = timed(s.pixelsShow, reps)
+    print("%5d LEDs: per-pixel %.3f ms/frame, lookup table %.3f ms/frame (%.1fx)" % (n, before, after, before / after))
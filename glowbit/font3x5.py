@@ -0,0 +1,97 @@
+font3x5 = bytearray([
+    0x00,0x00,0x00, # 32= 
+    0x00,0x17,0x00, # 33=!
+    0x03,0x00,0x03, # 34="
+    0x1f,0x0a,0x1f, # 35=#
+    0x12,0x15,0x09, # 36=$
+    0x19,0x04,0x13, # 37=%
+    0x0a,0x15,0x1a, # 38=&
+    0x00,0x03,0x00, # 39='
+    0x00,0x0e,0x11, # 40=(
+    0x11,0x0e,0x00, # 41=)
+    0x0a,0x04,0x0a, # 42=*
+    0x04,0x0e,0x04, # 43=+
+    0x10,0x08,0x00, # 44=,
+    0x04,0x04,0x04, # 45=-
+    0x00,0x10,0x00, # 46=.
+    0x18,0x04,0x03, # 47=/
+    0x1f,0x11,0x1f, # 48=0
+    0x12,0x1f,0x10, # 49=1
+    0x19,0x15,0x12, # 50=2
+    0x11,0x15,0x0a, # 51=3
+    0x07,0x04,0x1f, # 52=4
+    0x17,0x15,0x09, # 53=5
+    0x1e,0x15,0x1d, # 54=6
+    0x01,0x1d,0x03, # 55=7
+    0x1f,0x15,0x1f, # 56=8
+    0x17,0x15,0x0f, # 57=9
+    0x00,0x0a,0x00, # 58=:
+    0x10,0x0a,0x00, # 59=;
+    0x04,0x0a,0x11, # 60=<
+    0x0a,0x0a,0x0a, # 61==
+    0x11,0x0a,0x04, # 62=>
+    0x01,0x15,0x02, # 63=?
+    0x0e,0x15,0x16, # 64=@
+    0x1e,0x05,0x1e, # 65=A
+    0x1f,0x15,0x0a, # 66=B
+    0x0e,0x11,0x11, # 67=C
+    0x1f,0x11,0x0e, # 68=D
+    0x1f,0x15,0x11, # 69=E
+    0x1f,0x05,0x01, # 70=F
+    0x0e,0x11,0x1d, # 71=G
+    0x1f,0x04,0x1f, # 72=H
+    0x11,0x1f,0x11, # 73=I
+    0x08,0x10,0x0f, # 74=J
+    0x1f,0x04,0x1b, # 75=K
+    0x1f,0x10,0x10, # 76=L
+    0x1f,0x02,0x1f, # 77=M
+    0x1f,0x01,0x1e, # 78=N
+    0x0e,0x11,0x0e, # 79=O
+    0x1f,0x05,0x02, # 80=P
+    0x0e,0x19,0x16, # 81=Q
+    0x1f,0x05,0x1a, # 82=R
+    0x12,0x15,0x09, # 83=S
+    0x01,0x1f,0x01, # 84=T
+    0x0f,0x10,0x1f, # 85=U
+    0x07,0x18,0x07, # 86=V
+    0x1f,0x0c,0x1f, # 87=W
+    0x1b,0x04,0x1b, # 88=X
+    0x03,0x1c,0x03, # 89=Y
+    0x19,0x15,0x13, # 90=Z
+    0x1f,0x11,0x00, # 91=[
+    0x03,0x04,0x18, # 92=\
+    0x00,0x11,0x1f, # 93=]
+    0x02,0x01,0x02, # 94=^
+    0x10,0x10,0x10, # 95=_
+    0x01,0x02,0x00, # 96=`
+    0x0c,0x12,0x1e, # 97=a
+    0x1f,0x12,0x0c, # 98=b
+    0x0c,0x12,0x12, # 99=c
+    0x0c,0x12,0x1f, # 100=d
+    0x0c,0x16,0x16, # 101=e
+    0x04,0x1e,0x05, # 102=f
+    0x14,0x1a,0x0e, # 103=g
+    0x1f,0x02,0x1c, # 104=h
+    0x00,0x1d,0x00, # 105=i
+    0x08,0x10,0x0d, # 106=j
+    0x1f,0x0c,0x12, # 107=k
+    0x11,0x1f,0x10, # 108=l
+    0x1e,0x06,0x1e, # 109=m
+    0x1e,0x02,0x1c, # 110=n
+    0x0c,0x12,0x0c, # 111=o
+    0x1e,0x0a,0x04, # 112=p
+    0x04,0x0a,0x1e, # 113=q
+    0x1c,0x02,0x02, # 114=r
+    0x10,0x16,0x0a, # 115=s
+    0x02,0x0f,0x12, # 116=t
+    0x0e,0x10,0x1e, # 117=u
+    0x06,0x18,0x06, # 118=v
+    0x1e,0x08,0x1e, # 119=w
+    0x12,0x0c,0x12, # 120=x
+    0x16,0x08,0x06, # 121=y
+    0x1a,0x16,0x12, # 122=z
+    0x04,0x1b,0x11, # 123={
+    0x00,0x1f,0x00, # 124=|
+    0x11,0x1b,0x04, # 125=}
+    0x02,0x06,0x04, # 126=~
+])
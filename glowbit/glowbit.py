@@ -31,10 +31,149 @@ if _SYSNAME == 'Linux':
 
 
 from petme128 import petme128
+from font3x5 import font3x5
+from font5x7 import font5x7
 import time
 import array
 import gc
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# gc.mem_alloc() is MicroPython only; without it allocations are not measured
+_gcMemAlloc = getattr(gc, "mem_alloc", None)
+
+try:
+    import asyncio
+except ImportError:
+    try:
+        import uasyncio as asyncio
+    except ImportError:
+        asyncio = None
+
+
+## @brief Adds two packed 32-bit GlowBit colours with each colour channel saturating at 255.
+#
+# The red and blue channels are added in one operation and the green channel in another, leaving a spare bit above each channel to detect overflow. This works on integers and on NumPy uint32 arrays.
+
+def _saturatingAdd(a, b):
+    rb = (a & 0xFF00FF) + (b & 0xFF00FF)
+    g = (a & 0x00FF00) + (b & 0x00FF00)
+    rb |= ((rb & 0x1000100) >> 8) * 0xFF
+    g |= ((g & 0x10000) >> 8) * 0xFF
+    return (rb & 0xFF00FF) | (g & 0x00FF00)
+
+## @brief Multiplies each channel of a packed 32-bit GlowBit colour by an integer, saturating at 255.
+
+def _scaleColourSaturating(colour, n):
+    r = min(((colour >> 16) & 0xFF) * n, 255)
+    g = min(((colour >> 8) & 0xFF) * n, 255)
+    b = min((colour & 0xFF) * n, 255)
+    return (r << 16) | (g << 8) | b
+
+## Channel masks for a single packed colour: (red and blue, green, red and blue carry bits, green carry bit)
+_LANES = (0xFF00FF, 0x00FF00, 0x1000100, 0x10000)
+
+_swarLanesCache = {}
+
+## @brief Returns the channel masks of _LANES repeated for n packed colours held in one integer, so the SWAR operations below process a whole buffer in a few big integer operations.
+#
+# The last element is the integer with a 1 in each colour's lowest bit; multiplying a colour by it repeats the colour n times.
+
+def _swarLanes(n):
+    lanes = _swarLanesCache.get(n)
+    if lanes is None:
+        ones = int.from_bytes(b"\x01\x00\x00\x00"*n, "little")
+        lanes = (ones*0xFF00FF, ones*0x00FF00, ones*0x1000100, ones*0x10000, ones)
+        if len(_swarLanesCache) >= 8:
+            _swarLanesCache.clear()
+        _swarLanesCache[n] = lanes
+    return lanes
+
+## @brief Multiplies two packed 32-bit GlowBit colours channel by channel, scaled so that 255 * x = x. Works on integers and NumPy uint32 arrays.
+
+def _multiplyColour(a, b):
+    r = ((a >> 16) & 0xFF) * ((b >> 16) & 0xFF) + 128
+    g = ((a >> 8) & 0xFF) * ((b >> 8) & 0xFF) + 128
+    b = (a & 0xFF) * (b & 0xFF) + 128
+    return ((((r + (r >> 8)) >> 8) << 16) | (((g + (g >> 8)) >> 8) << 8) | ((b + (b >> 8)) >> 8))
+
+## @brief Blends packed 32-bit GlowBit colours b onto a.
+#
+# a and b can be integers, NumPy uint32 arrays, or big integers holding many packed colours with lanes from _swarLanes(). Apart from "Multiply" every mode is computed with SWAR arithmetic: the red and blue channels are processed together and the green channel separately, with a spare bit above each channel so no channel can overflow into its neighbour.
+#
+# \param mode "Add" (saturating add), "Max" (per-channel maximum), "Multiply" or "Over" (b replaces a)
+# \param alpha The opacity of b in the range [0,256]. The blended result is mixed with a in proportion alpha/256.
+# \param lanes _LANES, or _swarLanes(n) when a and b are big integers
+
+def _blendColours(a, b, mode, alpha = 256, lanes = _LANES):
+    RB = lanes[0]
+    G = lanes[1]
+    if mode == "Add":
+        rb = (a & RB) + (b & RB)
+        g = (a & G) + (b & G)
+        rb |= ((rb & lanes[2]) >> 8) * 0xFF
+        g |= ((g & lanes[3]) >> 8) * 0xFF
+        r = (rb & RB) | (g & G)
+    elif mode == "Max":
+        # The carry bit of each channel survives the subtraction only where a >= b
+        rb = ((a & RB) | lanes[2]) - (b & RB)
+        g = ((a & G) | lanes[3]) - (b & G)
+        m = (((rb & lanes[2]) >> 8) * 0xFF) | (((g & lanes[3]) >> 8) * 0xFF)
+        r = (a & m) | (b & ((RB | G) ^ m))
+    elif mode == "Multiply":
+        r = _multiplyColour(a, b)
+    elif mode == "Over":
+        r = b
+    else:
+        raise ValueError("Unknown blend mode: " + str(mode))
+    if alpha < 256:
+        rb = ((a & RB)*(256 - alpha) + (r & RB)*alpha) >> 8
+        g = ((a & G)*(256 - alpha) + (r & G)*alpha) >> 8
+        r = (rb & RB) | (g & G)
+    return r
+
+## @brief Blends a colour, or a sequence of colours, into the run [lo, hi) of an array("I") buffer. See glowbit.blendBuffer().
+#
+# \param src A packed colour, or a sequence (array("I"), memoryview, list or NumPy array) of at least hi - lo colours
+# \param alpha The opacity of the blended result in the range [0,256]
+
+def _blendRun(ar, lo, hi, src, mode, alpha):
+    n = hi - lo
+    scalar = isinstance(src, int)
+    if numpy is not None:
+        dst = numpy.frombuffer(ar, dtype=numpy.uint32)[lo:hi]
+        if scalar == True:
+            b = numpy.uint32(src)
+        else:
+            b = numpy.asarray(src, dtype=numpy.uint32)[:n]
+        dst[:] = _blendColours(dst, b, mode, alpha)
+    elif mode == "Multiply" and scalar == False:
+        for k in range(n):
+            ar[lo+k] = _blendColours(ar[lo+k], src[k], mode, alpha)
+    elif mode == "Multiply":
+        for k in range(lo, hi):
+            ar[k] = _blendColours(ar[k], src, mode, alpha)
+    else:
+        lanes = _swarLanes(n)
+        a = int.from_bytes(bytes(memoryview(ar)[lo:hi]), "little")
+        if scalar == True:
+            b = src*lanes[4]
+        else:
+            if isinstance(src, array.array):
+                src = memoryview(src)
+            elif not isinstance(src, memoryview):
+                src = array.array("I", src[:n])
+            b = int.from_bytes(bytes(src[:n]), "little")
+        r = _blendColours(a, b, mode, alpha, lanes)
+        ar[lo:hi] = array.array("I", bytearray(r.to_bytes(4*n, "little")))
 
 ## @brief
 #
@@ -47,6 +186,8 @@ import gc
 # where RR, GG, and BB are hexadecimal values (decimal [0,255]) and the most significant 8 bits are reserved and left as zero.
 
 class colourFunctions():
+    # No instance attributes, so classes with __slots__ (eg: stick.pulse) which use these methods need no __dict__
+    __slots__ = ()
 
     ## @brief Converts an integer "colour wheel position" to a packed 32-bit RGB GlowBit colour value.
     #
@@ -128,6 +269,8 @@ class colourFunctions():
 # def colourMapFunction(self, index, minIndex, maxIndex):
 
 class colourMaps():
+    # See colourFunctions
+    __slots__ = ()
 
     ## @brief Trivial colourmap method which always returns the colour in the parent object.
     #
@@ -149,9 +292,778 @@ class colourMaps():
     def colourMapRainbow(self, index, minIndex, maxIndex):
         return self.wheel(int(((index-minIndex)*255)/(maxIndex-minIndex)))
 
+    _colourTables = None
+
+    ## @brief Returns the colour map sampled at count indices as an array("I") lookup table.
+    #
+    # Entry k of the table is colourMap(first + k*step, minIndex, maxIndex). Tables are compiled on first use and kept until the colour map, the colour or the range changes, so drawing a graph only indexes the table rather than calling the colour map for every pixel.
+    #
+    # \param first The first index to be mapped
+    # \param count The number of indices to be mapped
+    # \param step The increment between consecutive indices
+    # \param minIndex Passed to the colour map function
+    # \param maxIndex Passed to the colour map function
+    # \return An array("I") of 32-bit packed GlowBit colour values
+
+    def colourMapTable(self, first, count, step, minIndex, maxIndex):
+        if self._colourTables is None:
+            self._colourTables = {}
+        key = (first, count, step, minIndex, maxIndex)
+        entry = self._colourTables.get(key)
+        if entry is not None and entry[0] == self.colourMap and entry[1] == self.colour:
+            return entry[2]
+        m = self.colourMap
+        table = array.array("I", [m(first + k*step, minIndex, maxIndex) for k in range(count)])
+        if len(self._colourTables) >= 4:
+            self._colourTables = {}
+        self._colourTables[key] = (m, self.colour, table)
+        return table
+
+    ## @brief Discards the compiled colour map tables. Call this after changing state a custom colour map depends on, other than the colour map itself or the colour.
+
+    def invalidateColourMap(self):
+        self._colourTables = None
+
+## @brief A small least-recently-used cache with a bounded number of entries.
+#
+# Used to cache decoded font glyphs so memory use stays bounded on the Raspberry Pi Pico.
+
+class lruCache():
+
+    ## @brief Initialisation routine for the lruCache object.
+    #
+    # \param size The maximum number of entries. When the cache is full the least recently used entry is discarded.
+
+    def __init__(self, size = 64):
+        self.size = size
+        self._entries = OrderedDict()
+        ## Number of lookups which found an entry
+        self.hits = 0
+        ## Number of lookups which did not find an entry
+        self.misses = 0
+
+    ## @brief Returns the entry for a key, or None if the key is not in the cache.
+
+    def get(self, key):
+        entries = self._entries
+        if key in entries:
+            value = entries.pop(key)
+            entries[key] = value
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    ## @brief Adds an entry to the cache, discarding the least recently used entry if the cache is full.
+
+    def put(self, key, value):
+        entries = self._entries
+        if key in entries:
+            entries.pop(key)
+        while len(entries) >= self.size:
+            entries.pop(next(iter(entries)))
+        entries[key] = value
+
+    ## @brief Changes the maximum number of entries, discarding the least recently used entries if required.
+
+    def resize(self, size):
+        self.size = size
+        entries = self._entries
+        while len(entries) > size:
+            entries.pop(next(iter(entries)))
+
+    ## @brief Removes all entries from the cache.
+
+    def clear(self):
+        self._entries = OrderedDict()
+
+## @brief A bit-packed bitmap font up to 8 pixels high.
+#
+# Each glyph is stored as a run of column bytes with bit n set for a lit pixel in row n, the same layout as the petme128 font. A font is read from a compact binary image:
+#
+# | Offset | Size | Field |
+# | ------ | ---- | ----- |
+# | 0 | 2 | Magic bytes "GF" |
+# | 2 | 1 | Format version (1) |
+# | 3 | 1 | Glyph height in pixels, 1 to 8 |
+# | 4 | 1 | Glyph width in pixels; the widest glyph for indexed fonts |
+# | 5 | 1 | Spacing: blank columns drawn after each glyph |
+# | 6 | 1 | Flags; bit 0 set for an indexed font |
+# | 7 | 1 | Reserved (0) |
+# | 8 | 2 | Number of glyphs, little endian |
+# | 10 | 2 | First codepoint of a fixed-width font, little endian |
+#
+# A fixed-width font's glyphs follow the header in codepoint order. An indexed font is followed by one 5-byte index entry per glyph (codepoint, width and bitmap offset; 16-bit values little endian) sorted by codepoint, then the bitmaps. Indexed fonts can hold any set of codepoints up to U+FFFF and glyphs of different widths.
+#
+# A font can be created from a bytes-like object or from the path of a font file. Fonts loaded from a file only keep the header and index in memory; glyph bitmaps are read from the file when they are first drawn, so a large font only costs the RAM of the glyphs in use.
+#
+# Text can be laid out on the font's fixed advance or proportionally, where each glyph is trimmed to its lit columns and followed by a one column gap. See render() and measure().
+
+class bitmapFont():
+    FLAG_INDEXED = 0x01
+    _HEADER = 12
+    _INDEX_ENTRY = 5
+
+    ## @brief Initialisation routine for the bitmapFont object.
+    #
+    # \param source A bytes-like object holding a font image, or the path of a font file.
+
+    def __init__(self, source):
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            self._data = None
+            header = self._file.read(self._HEADER)
+        else:
+            self._file = None
+            self._data = memoryview(source)
+            header = self._data[0:self._HEADER]
+        if len(header) < self._HEADER or bytes(header[0:2]) != b"GF" or header[2] != 1:
+            raise ValueError("Not a GlowBit font")
+        self.height = header[3]
+        self.width = header[4]
+        self.spacing = header[5]
+        self.indexed = bool(header[6] & self.FLAG_INDEXED)
+        self.count = header[8] | (header[9] << 8)
+        self.first = header[10] | (header[11] << 8)
+        if self.indexed:
+            size = self.count*self._INDEX_ENTRY
+            if self._file is None:
+                self._index = self._data[self._HEADER:self._HEADER + size]
+            else:
+                self._index = self._file.read(size)
+            self._bitmaps = self._HEADER + size
+        else:
+            self._index = None
+            self._bitmaps = self._HEADER
+        self._metrics = {}
+        self._layouts = lruCache(8)
+
+    ## @brief Builds a fixed-width font image from a run of glyph bitmaps, such as the petme128 font.
+    #
+    # \param columns A bytes-like object holding width column bytes for each glyph, in codepoint order
+    # \param width The width of each glyph in pixels
+    # \param height The height of each glyph in pixels, 1 to 8
+    # \param first The codepoint of the first glyph
+    # \param spacing The number of blank columns drawn after each glyph
+    # \return A bitmapFont
+
+    @staticmethod
+    def fixed(columns, width, height, first = 32, spacing = 0):
+        count = len(columns)//width
+        header = bytes([0x47, 0x46, 1, height, width, spacing, 0, 0, count & 0xFF, count >> 8, first & 0xFF, first >> 8])
+        return bitmapFont(header + bytes(columns))
+
+    ## @brief Builds an indexed font image from a dictionary of glyphs.
+    #
+    # The returned bytes can be passed to bitmapFont() or written to a file and loaded lazily.
+    #
+    # \param glyphs A dictionary mapping codepoints (or single character strings) to bytes-like objects of column bytes. Glyphs may have different widths.
+    # \param height The height of the glyphs in pixels, 1 to 8
+    # \param spacing The number of blank columns drawn after each glyph
+    # \return The font image as bytes
+    #
+    # The index stores 16-bit codepoints, glyph counts and bitmap offsets and 8-bit glyph widths. A ValueError naming the glyph is raised if a glyph does not fit.
+
+    @staticmethod
+    def pack(glyphs, height, spacing = 1):
+        entries = []
+        for key in glyphs:
+            codepoint = ord(key) if isinstance(key, str) else key
+            if codepoint < 0 or codepoint > 0xFFFF:
+                raise ValueError("Glyph U+%04X is outside U+0000 to U+FFFF" % codepoint)
+            columns = bytes(glyphs[key])
+            if len(columns) > 0xFF:
+                raise ValueError("Glyph U+%04X is wider than 255 columns" % codepoint)
+            entries.append((codepoint, columns))
+        entries.sort()
+        count = len(entries)
+        if count > 0xFFFF:
+            raise ValueError("A font holds at most 65535 glyphs, not " + str(count))
+        width = 0
+        index = bytearray()
+        bitmaps = bytearray()
+        for (codepoint, columns) in entries:
+            offset = len(bitmaps)
+            if offset > 0xFFFF:
+                raise ValueError("Glyph U+%04X starts past the 64 KiB bitmap limit" % codepoint)
+            index.extend(bytes([codepoint & 0xFF, codepoint >> 8, len(columns), offset & 0xFF, offset >> 8]))
+            bitmaps.extend(columns)
+            width = max(width, len(columns))
+        header = bytes([0x47, 0x46, 1, height, width, spacing, bitmapFont.FLAG_INDEXED, 0, count & 0xFF, count >> 8, 0, 0])
+        return header + bytes(index) + bytes(bitmaps)
+
+    ## @brief Returns the column bytes of a character's glyph, or None if the character is not in the font.
+    #
+    # \param char A single character string
+
+    def columns(self, char):
+        if self.indexed:
+            j = self._find(ord(char))
+            if j < 0:
+                return None
+            index = self._index
+            return self._read(self._bitmaps + (index[j+3] | (index[j+4] << 8)), index[j+2])
+        code = ord(char) - self.first
+        if code < 0 or code >= self.count:
+            return None
+        return self._read(self._bitmaps + code*self.width, self.width)
+
+    ## @brief Returns the horizontal distance in pixels from the start of a character to the start of the next, including spacing.
+    #
+    # Characters not in the font advance by the font's width.
+    #
+    # \param char A single character string
+
+    def advance(self, char):
+        if self.indexed:
+            j = self._find(ord(char))
+            if j >= 0:
+                return self._index[j+2] + self.spacing
+        return self.width + self.spacing
+
+    ## @brief Returns the (left, width) extents of a character's glyph: its first lit column and the number of columns up to its last lit column.
+    #
+    # Glyphs with no lit pixels (eg: space) and characters not in the font are given the width of a proportional space. Extents are computed once per character and cached.
+    #
+    # \param char A single character string
+
+    def metrics(self, char):
+        m = self._metrics.get(char)
+        if m is None:
+            columns = self.columns(char)
+            left = 0
+            right = -1
+            if columns is not None:
+                for col in range(len(columns)):
+                    if columns[col]:
+                        if right < 0:
+                            left = col
+                        right = col
+            if right < 0:
+                m = (0, max(1, self.width//2 - self._gap()))
+            else:
+                m = (left, right - left + 1)
+            self._metrics[char] = m
+        return m
+
+    ## @brief Renders a string into a strip of column bytes, one per pixel column with bit n set for a lit pixel in row n.
+    #
+    # The most recently rendered strings are cached, so rendering the same string again is free.
+    #
+    # \param string The string to render
+    # \param proportional If False each character occupies its advance() width. If True each glyph is trimmed to its lit columns (see metrics()) and followed by a gap of one column, or the font's spacing if larger.
+    # \return A bytearray of column bytes. Its length is the pixel width of the text.
+
+    def render(self, string, proportional = False):
+        key = (string, proportional)
+        strip = self._layouts.get(key)
+        if strip is None:
+            strip = bytearray()
+            gap = bytes(self._gap())
+            for char in string:
+                columns = self.columns(char)
+                if proportional:
+                    (left, width) = self.metrics(char)
+                    if columns is None:
+                        strip.extend(bytes(width))
+                    else:
+                        strip.extend(columns[left:left + width])
+                    strip.extend(gap)
+                else:
+                    advance = self.advance(char)
+                    if columns is None:
+                        strip.extend(bytes(advance))
+                    else:
+                        strip.extend(columns)
+                        strip.extend(bytes(advance - len(columns)))
+            self._layouts.put(key, strip)
+        return strip
+
+    ## @brief Returns the width of a string in pixels when laid out with render().
+    #
+    # \param string The string to measure
+    # \param proportional Measure proportional (True) or fixed advance (False) layout
+
+    def measure(self, string, proportional = False):
+        return len(self.render(string, proportional))
+
+    def _gap(self):
+        return max(1, self.spacing)
+
+    ## @brief Returns the offset of a codepoint's entry in the index of an indexed font, or -1 if it is not in the font.
+
+    def _find(self, codepoint):
+        index = self._index
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            j = mid*self._INDEX_ENTRY
+            c = index[j] | (index[j+1] << 8)
+            if c < codepoint:
+                lo = mid + 1
+            elif c > codepoint:
+                hi = mid
+            else:
+                return j
+        return -1
+
+    def _read(self, offset, length):
+        if self._file is None:
+            return self._data[offset:offset + length]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    ## @brief Closes the font file of a lazily loaded font.
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+## The registered fonts, by name. Use registerFont() to add a font.
+fonts = {}
+
+## @brief Registers a font so it can be selected by name in drawChar() and printTextWrap().
+#
+# \param name The font's name
+# \param font A bitmapFont, or the path of a font file. A font file is not opened until the font is first used.
+
+def registerFont(name, font):
+    fonts[name] = font
+
+## @brief Returns a registered font by name, loading it from its file on first use.
+#
+# \param font A font name, a bitmapFont (which is returned unchanged) or None for the default petme128 font.
+
+def getFont(font = None):
+    if font is None:
+        font = "petme128"
+    if not isinstance(font, str):
+        return font
+    f = fonts[font]
+    if isinstance(f, str):
+        f = bitmapFont(f)
+        fonts[font] = f
+    return f
+
+registerFont("petme128", bitmapFont.fixed(petme128, 8, 8))
+registerFont("3x5", bitmapFont.fixed(font3x5, 3, 5, spacing = 1))
+registerFont("5x7", bitmapFont.fixed(font5x7, 5, 7, spacing = 1))
+
+## @brief A stand-in for rp2.StateMachine which records the words written to it.
+#
+# Lets the Raspberry Pi Pico output path be exercised on other platforms, see glowbit.attachStateMachine(). Each word is stored as the state machine would receive it, after the put() shift, so the GRB colour of an LED is in the top 24 bits.
+
+class simulatedStateMachine():
+
+    def __init__(self):
+        ## The 32-bit words written to the TX FIFO, oldest first
+        self.words = array.array("I")
+        ## The number of put() calls
+        self.puts = 0
+
+    def active(self, value = None):
+        return 1
+
+    ## @brief Records an integer, or every word of an array or buffer, shifted left by shift bits.
+
+    def put(self, value, shift = 0):
+        self.puts += 1
+        if type(value) is int:
+            self.words.append((value << shift) & 0xFFFFFFFF)
+            return
+        for v in value:
+            self.words.append((v << shift) & 0xFFFFFFFF)
+
+    ## @brief Returns the recorded words as packed 32-bit GlowBit (RGB) colours.
+
+    def colours(self):
+        out = array.array("I")
+        for w in self.words:
+            out.append((w & 0xFF0000) | ((w >> 16) & 0xFF00) | ((w >> 8) & 0xFF))
+        return out
+
+    ## @brief Discards the recorded words.
+
+    def clear(self):
+        self.words = array.array("I")
+        self.puts = 0
+
+## @brief Drives several GlowBit chains from one process, each chain carrying a consecutive part of one or more displays.
+#
+# The LEDs of a display are split across chains (see span()) and all chains stream at the same time, so a display split over N chains refreshes up to N times faster than the same display on a single chain. show() sends the frames of every spanned display in one synchronized transfer, and a spanned display's own pixelsShow() streams all of its chains at once.
+#
+# On the Raspberry Pi Pico each chain is driven by its own PIO state machine (0-7). If rp2.DMA is available every chain gets a DMA channel and the channels are started back to back; otherwise the LED words are written to the state machines in turn, one LED per chain, so every FIFO is kept fed.
+#
+# On the Raspberry Pi the two PWM channels of rpi_ws281x are driven by one DMA transfer: channel 0 on GPIO 12 or 18 and channel 1 on GPIO 13 or 19. Chains on other pins (GPIO 10 for SPI, GPIO 21 for PCM) get their own PixelStrip and are started right after.
+#
+# Example:
+# \code
+# wall = glowbit.matrix8x8(tileRows = 2, tileCols = 4)
+# chains = glowbit.multiChain([18, 19])
+# chains.span(wall)           # tiles 0-3 on pin 18, tiles 4-7 on pin 19
+# wall.pixelsFill(wall.red())
+# wall.pixelsShow()           # both chains stream at once
+# \endcode
+
+class multiChain():
+    _PWM0 = (12, 18, 40, 52)
+    _PWM1 = (13, 19, 41, 45, 53)
+
+    ## @brief Initialisation routine for the multiChain object.
+    #
+    # \param chains A list with one entry per chain: the GPIO pin number of the chain, or an object already driving it, either a state machine with an rp2.StateMachine style put() method (eg: a simulatedStateMachine) or an rpi_ws281x PixelStrip.
+    # \param sms (Raspberry Pi Pico only) The PIO state machine number of each chain. Defaults to 0, 1, 2, ...
+    # \param dma (Raspberry Pi only) The DMA channel of each chain which is not on a PWM pin. Defaults to 11, 12, ... The PWM chains share DMA channel 10.
+
+    def __init__(self, chains, sms = None, dma = None):
+        self.chains = list(chains)
+        n = len(self.chains)
+        if sms is None:
+            sms = list(range(n))
+        if dma is None:
+            dma = [11 + k for k in range(n)]
+        if len(sms) < n or len(dma) < n:
+            raise ValueError("sms and dma need one entry per chain")
+        self._sms = sms
+        self._dmaNumbers = dma
+        ## The displays spanned across the chains, in the order span() was called
+        self.displays = []
+        self._outputs = [None for _ in range(n)]
+        self._buffers = [None for _ in range(n)]
+        self._views = [None for _ in range(n)]
+        self._writers = [None for _ in range(n)]
+        self._dmas = [None for _ in range(n)]
+        self._ctrls = [0 for _ in range(n)]
+        # Per chain: output kind (0 sm.put(), 1 DMA, 2 PixelStrip, 3 shared PWM channel), first LED of the display and number of LEDs
+        self._kinds = array.array("i", bytearray(4*n))
+        self._starts = array.array("i", bytearray(4*n))
+        self._counts = array.array("i", bytearray(4*n))
+        self._staged = array.array("i", bytearray(4*n))
+        self._free = 0
+        self._hold = False
+        self._pwm = None
+        self._pwmReady = False
+        if _SYSNAME == 'Linux':
+            pwm = [c for c in self.chains if type(c) is int and (c in self._PWM0 or c in self._PWM1)]
+            if len([c for c in pwm if c in self._PWM0]) > 1 or len([c for c in pwm if c in self._PWM1]) > 1:
+                raise ValueError("At most one chain per PWM channel: GPIO 12/18 and GPIO 13/19")
+
+    ## @brief Spans a display across the next unused chains.
+    #
+    # The display's LEDs, in buffer order, are split into consecutive segments, one per chain. From then on the display's pixelsShow() sends its frame down these chains. On the Raspberry Pi the display's own PixelStrip is released so its pin can be reused by a chain.
+    #
+    # \param display A GlowBit display object, eg: a glowbit.matrix8x8 or glowbit.stick
+    # \param lengths A list with the number of LEDs on each chain. Defaults to splitting the display evenly over all remaining chains.
+
+    def span(self, display, lengths = None):
+        first = self._free
+        N = len(display.ar)
+        if lengths is None:
+            k = len(self.chains) - first
+            if k <= 0 or N % k != 0:
+                raise ValueError("Cannot split " + str(N) + " LEDs evenly over " + str(k) + " chains, give the chain lengths")
+            lengths = [N//k for _ in range(k)]
+        if first + len(lengths) > len(self.chains):
+            raise ValueError("Not enough free chains")
+        if sum(lengths) != N:
+            raise ValueError("Chain lengths must add up to the " + str(N) + " LEDs of the display")
+        last = first + len(lengths)
+        if _SYSNAME == 'Linux' and getattr(display, "strip", None) is not None and any(type(self.chains[k]) is int for k in range(first, last)):
+            cleanup = getattr(display.strip, "_cleanup", None)
+            if cleanup is not None:
+                cleanup()
+            display.strip = None
+        start = 0
+        pico = True
+        for k in range(first, last):
+            self._starts[k] = start
+            self._counts[k] = lengths[k - first]
+            self._buffers[k] = display.dimmer_ar
+            self._views[k] = memoryview(display.dimmer_ar)[start:start + lengths[k - first]]
+            self._openChain(k)
+            if self._kinds[k] != 1:
+                pico = False
+            start += lengths[k - first]
+        # The DMA channels read the shared buffer pre-shifted, so DMA is only used if every chain of the display has one
+        if not pico:
+            for k in range(first, last):
+                if self._kinds[k] == 1:
+                    self._dmas[k].close()
+                    self._dmas[k] = None
+                    self._kinds[k] = 0
+        display._multiChain = self
+        display._chainFirst = first
+        display._chainLast = last
+        self._free = last
+        self.displays.append(display)
+        display.invalidateFrame()
+
+    # Opens the output of chain k and sets its kind
+    def _openChain(self, k):
+        chain = self.chains[k]
+        count = self._counts[k]
+        if type(chain) is int:
+            if _SYSNAME == 'rp2':
+                chain = rp2.StateMachine(self._sms[k], glowbit._ws2812, freq=8_000_000, sideset_base=Pin(chain))
+                chain.active(1)
+            elif chain in self._PWM0 or chain in self._PWM1:
+                self._openPWM(k, chain, count)
+                return
+            else:
+                chain = ws.PixelStrip(count, chain, 800000, self._dmaNumbers[k])
+                chain.begin()
+        self._outputs[k] = chain
+        if hasattr(chain, "put"):
+            self._kinds[k] = 0
+            if hasattr(rp2, "DMA") and not isinstance(chain, simulatedStateMachine):
+                dma = rp2.DMA()
+                smId = self._sms[k]
+                self._dmas[k] = dma
+                self._ctrls[k] = dma.pack_ctrl(size=2, inc_write=False, treq_sel=(smId >> 2)*8 + (smId & 3))
+                self._kinds[k] = 1
+        else:
+            self._kinds[k] = 2
+            self._writers[k] = self._stripWriter(k)
+
+    # Configures chain k as a channel of the rpi_ws281x instance shared by both PWM channels, which is initialised on first use
+    def _openPWM(self, k, pin, count):
+        if self._pwm is None:
+            self._pwm = ws.new_ws2811_t()
+            for c in range(2):
+                channel = ws.ws2811_channel_get(self._pwm, c)
+                ws.ws2811_channel_t_count_set(channel, 0)
+                ws.ws2811_channel_t_gpionum_set(channel, 0)
+                ws.ws2811_channel_t_invert_set(channel, 0)
+                ws.ws2811_channel_t_brightness_set(channel, 0)
+            ws.ws2811_t_freq_set(self._pwm, 800000)
+            ws.ws2811_t_dmanum_set(self._pwm, 10)
+        elif self._pwmReady:
+            ws.ws2811_fini(self._pwm)
+            self._pwmReady = False
+        channel = ws.ws2811_channel_get(self._pwm, 1 if pin in self._PWM1 else 0)
+        ws.ws2811_channel_t_count_set(channel, count)
+        ws.ws2811_channel_t_gpionum_set(channel, pin)
+        ws.ws2811_channel_t_brightness_set(channel, 255)
+        ws.ws2811_channel_t_strip_type_set(channel, ws.WS2811_STRIP_GRB)
+        self._outputs[k] = channel
+        self._kinds[k] = 3
+
+    def _beginPWM(self):
+        resp = ws.ws2811_init(self._pwm)
+        if resp != 0:
+            raise RuntimeError("ws2811_init failed with code " + str(resp))
+        self._pwmReady = True
+        for k in range(len(self.chains)):
+            if self._kinds[k] == 3:
+                self._writers[k] = self._pwmWriter(k)
+
+    # Returns a function writing scaled[lo:hi] of the display to chain k's PixelStrip, using the fastest method the strip supports
+    def _stripWriter(self, k):
+        strip = self._outputs[k]
+        s = self._starts[k]
+        try:
+            leds = strip.getPixels()
+            if len(leds) >= self._counts[k] and hasattr(leds, "__setitem__"):
+                def write(scaled, lo, hi):
+                    leds[lo - s:hi - s] = scaled[lo:hi]
+                return write
+        except Exception:
+            pass
+        def write(scaled, lo, hi):
+            setPixelColor = strip.setPixelColor
+            for i in range(lo, hi):
+                setPixelColor(i - s, scaled[i])
+        return write
+
+    def _pwmWriter(self, k):
+        channel = self._outputs[k]
+        s = self._starts[k]
+        try:
+            import ctypes
+            addr = int(ws.ws2811_channel_t_leds_get(channel))
+            if addr != 0:
+                def write(scaled, lo, hi):
+                    ctypes.memmove(addr + 4*(lo - s), scaled.buffer_info()[0] + 4*lo, 4*(hi - lo))
+                return write
+        except Exception:
+            pass
+        def write(scaled, lo, hi):
+            for i in range(lo, hi):
+                ws.ws2811_led_set(channel, i - s, scaled[i])
+        return write
+
+    # Called by the display's _pushFrame(): scales frame[lo:hi] and stages the chains it covers
+    def _pushDisplay(self, display, frame, lo, hi):
+        first = display._chainFirst
+        last = display._chainLast
+        kind = self._kinds[first]
+        if kind <= 1:
+            if kind == 1:
+                self._waitChains(first, last)
+            display._scaleFramePico(frame, display.dimmer_ar, lo, hi, 8 if kind == 1 else 0)
+            scaled = None
+        else:
+            if self._pwm is not None and not self._pwmReady:
+                self._beginPWM()
+            scaled = display._scaleFrame(frame, lo, hi)
+        starts = self._starts
+        counts = self._counts
+        for k in range(first, last):
+            s = starts[k]
+            e = s + counts[k]
+            if s < hi and e > lo:
+                self._staged[k] = 1
+                if scaled is not None:
+                    self._writers[k](scaled, max(s, lo), min(e, hi))
+        if not self._hold:
+            self._stream()
+
+    # Waits for the DMA transfers of chains first..last-1 to finish, then for the LEDs to latch
+    def _waitChains(self, first, last):
+        busy = False
+        for k in range(first, last):
+            dma = self._dmas[k]
+            if dma is not None and dma.active():
+                busy = True
+                while dma.active():
+                    pass
+        if busy:
+            time.sleep_us(glowbit._latch_us)
+
+    # Starts every staged chain streaming
+    def _stream(self):
+        staged = self._staged
+        kinds = self._kinds
+        n = len(staged)
+        put = False
+        pwm = False
+        for k in range(n):
+            if staged[k] != 0:
+                kind = kinds[k]
+                if kind == 1:
+                    self._dmas[k].config(read=self._views[k], write=self._outputs[k], count=self._counts[k], ctrl=self._ctrls[k], trigger=False)
+                elif kind == 0:
+                    put = True
+                elif kind == 3:
+                    pwm = True
+        for k in range(n):
+            if staged[k] != 0 and kinds[k] == 1:
+                self._dmas[k].active(1)
+        if pwm:
+            ws.ws2811_render(self._pwm)
+        for k in range(n):
+            if staged[k] != 0 and kinds[k] == 2:
+                self._outputs[k].show()
+        if put:
+            self._putInterleaved()
+        for k in range(n):
+            staged[k] = 0
+
+    # Writes the staged sm.put() chains one LED per chain in turn, so all of them stream at once
+    @micropython.viper
+    def _putInterleaved(self):
+        staged = ptr32(self._staged)
+        kinds = ptr32(self._kinds)
+        starts = ptr32(self._starts)
+        counts = ptr32(self._counts)
+        buffers = self._buffers
+        outputs = self._outputs
+        n = int(len(self._staged))
+        longest = 0
+        for k in range(n):
+            if staged[k] != 0 and kinds[k] == 0 and counts[k] > longest:
+                longest = counts[k]
+        for i in range(longest):
+            for k in range(n):
+                if staged[k] != 0 and kinds[k] == 0 and i < counts[k]:
+                    ar = ptr32(buffers[k])
+                    outputs[k].put(ar[starts[k] + i], 8)
+
+    ## @brief Shows the frames of all spanned displays in one synchronized transfer.
+    #
+    # The frame of each display goes through the same layer compositing, dirty tracking and unchanged-frame skipping as its pixelsShow(); then the chains of every display which changed start streaming together. The call is paced by the FPS limiter and GC policy of the first spanned display.
+
+    def show(self):
+        lead = self.displays[0]
+        lead._frameBegin()
+        lead._syncWait()
+        self._hold = True
+        try:
+            for d in self.displays:
+                d._showFrame(d._frame())
+        finally:
+            self._hold = False
+        self._stream()
+        lead._frameEnd()
+
 ## @brief Low-level methods common to all GlowBit classes
 
 class glowbit(colourFunctions, colourMaps):
+    ## How frames are written to the PIO state machine on the Raspberry Pi Pico: "Put", "Buffer" or "DMA". See setPicoOutput().
+    picoOutput = "Buffer"
+    sm = None
+    _smId = 0
+    _dma = None
+    _dmaCtrl = 0
+    _dmaBuffers = None
+    _dmaIndex = 0
+    # Time for the TX FIFO to drain and the LEDs to latch a frame after its DMA transfer ends
+    _latch_us = 500
+    _multiChain = None
+    _lutBrightness = None
+    _scaled_ar = array.array("I")
+    _stripWriter = None
+    _stripWriterFor = None
+    _frameSlot_ms = None
+    _frameSlotFrac = 0
+    _frameDeadline_ms = 0
+    _frameDeadlineFrac = 0
+    _frameInterval_us = None
+    _frameJitter_us = 0
+    ## When pixelsShow() runs the garbage collector: "Frames", "Threshold" or "Manual". See setGCPolicy().
+    gcPolicy = "Threshold"
+    ## With gcPolicy "Frames", the number of frames between collections
+    gcFrames = 1
+    ## With gcPolicy "Threshold", the number of bytes allocated since the last collection which triggers a collection
+    gcThreshold = 8192
+    ## Number of garbage collections run by pixelsShow(). See frameStats().
+    gcCollections = 0
+    ## Bytes allocated by the last pixelsShow() call, or None where gc.mem_alloc() is unavailable. See frameStats().
+    showAllocBytes = None
+    ## Bytes allocated between the end of the previous pixelsShow() call and the end of the last one (the whole frame, including drawing), or None where gc.mem_alloc() is unavailable.
+    frameAllocBytes = None
+    _showAllocStart = 0
+    _allocMark = None
+    _gcBase = 0
+    _gcFrameCount = 0
+    ## True while the background render thread started by startRenderThread() is running.
+    renderThread = False
+    ## Number of milliseconds at the end of each frame interval which are busy-waited instead of slept. Set to 0 (the default) to never busy-wait.
+    frameSpin_ms = 0
+    ## Number of frames shown since the frame statistics were last reset. See frameStats().
+    frames = 0
+    ## Number of frames released more than 1 ms after their scheduled slot. See frameStats().
+    lateFrames = 0
+    ## If True pixelsShow() skips the brightness scaling and hardware write when neither the internal buffer nor the brightness has changed since the last frame was sent.
+    skipUnchangedFrames = True
+    ## Number of frames skipped because they were unchanged. See frameStats().
+    framesSkipped = 0
+    ## Number of frames written to the physical LEDs. See frameStats().
+    framesPushed = 0
+    ## If True only the LEDs modified since the last frame are rescaled and re-uploaded by pixelsShow(). Drawing methods track the LEDs they modify automatically; markDirty() must be called after modifying ar[] directly. When False the single pixel methods (pixelSet(), pixelSetXY() etc) skip the tracking, so it costs them one attribute test.
+    dirtyTracking = False
+    # The dirty range is [_dirtyLo, _dirtyHi). An empty range is lo=_DIRTY_MAX, hi=0, so any markDirty() call replaces both ends; the whole display is lo=0, hi=_DIRTY_MAX, which is clipped to the buffer length when the range is used.
+    _DIRTY_MAX = 0x7FFFFFFF
+    _dirtyLo = 0
+    _dirtyHi = _DIRTY_MAX
+    _shownBrightness = None
+    _shown_ar = array.array("I")
+    ## The layers composited over the display's base buffer, bottom first. See addLayer().
+    layers = ()
+    _pendingGraphs = ()
+
     @rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_LEFT, autopull=True, pull_thresh=24)
     def _ws2812():
         T1 = 2
@@ -166,36 +1078,505 @@ class glowbit(colourFunctions, colourMaps):
         nop()                   .side(0)    [T2 - 1]
         wrap()
 
-    @micropython.viper
     def _pixelsShowPico(self):
-        self.__syncWait()
-        gc.collect()
-        ar = self.dimmer_ar
+        self._frameBegin()
+        self._syncWait()
+        self._showFrame(self._frame())
+        self._frameEnd()
+
+    ## @brief Selects how frames are written to the PIO state machine on the Raspberry Pi Pico.
+    #
+    # In every mode the frame is first scaled by the brightness into a GRB word buffer (dimmer_ar).
+    #
+    # \param mode "Put" writes the buffer with one sm.put() call per LED. "Buffer" (the default) writes the whole buffer with a single sm.put() call. "DMA" hands the buffer to a DMA channel paced by the state machine's TX FIFO and returns while the frame is still streaming, so the next frame can be drawn meanwhile; two buffers are used alternately so the one being streamed is never modified. If rp2.DMA is unavailable "DMA" writes the buffer with a single sm.put() call.
+
+    def setPicoOutput(self, mode = "Buffer"):
+        if mode not in ("Put", "Buffer", "DMA"):
+            raise ValueError("Invalid Pico output mode: " + str(mode))
+        if self._dma is not None:
+            self._waitDMA()
+            self._dma.close()
+            self._dma = None
+        self._dmaBuffers = None
+        self.picoOutput = mode
+        self.invalidateFrame()
+
+    ## @brief Sends frames to a state machine object instead of the GlowBit LEDs, using the Raspberry Pi Pico output path.
+    #
+    # Intended for testing the Pico output modes on other platforms with a simulatedStateMachine.
+    #
+    # \param sm An object with an rp2.StateMachine style put() method, eg: a simulatedStateMachine
+    # \param smId The state machine number used to select the DMA request signal in "DMA" mode
+
+    def attachStateMachine(self, sm, smId = 0):
+        self.sm = sm
+        self._smId = smId
+        self._dma = None
+        self._dmaBuffers = None
+        self.pixelsShow = self._pixelsShowPico
+        self.invalidateFrame()
+
+    def _pushFramePico(self, frame, lo, hi):
+        mode = self.picoOutput
+        if mode == "DMA":
+            self._pushFrameDMA(frame)
+            return
+        self._scaleFramePico(frame, self.dimmer_ar, lo, hi, 0)
+        if mode == "Put":
+            self._putWordsPico(self.dimmer_ar)
+        else:
+            self.sm.put(self.dimmer_ar, 8)
+
+    # Scales frame[lo:hi] by the brightness into GRB words shifted left by shift bits. Allocates nothing: both buffers are accessed through raw pointers.
+    @micropython.viper
+    def _scaleFramePico(self, frame, out, lo: int, hi: int, shift: int):
+        ar = ptr32(out)
+        src = ptr32(frame)
         br = int(self.brightness)
-        for i,c in enumerate(self.ar):
-            r = int((((int(c) >> 16) & 0xFF) * br) >> 8)
-            g = int((((int(c) >> 8) & 0xFF) * br) >> 8)
-            b = int(((int(c) & 0xFF) * br) >> 8)
-            ar[i] = (g<<16) | (r<<8) | b    
+        for i in range(lo, hi):
+            c = src[i]
+            r = int((((c >> 16) & 0xFF) * br) >> 8)
+            g = int((((c >> 8) & 0xFF) * br) >> 8)
+            b = int(((c & 0xFF) * br) >> 8)
+            ar[i] = ((g<<16) | (r<<8) | b) << shift
+
+    @micropython.viper
+    def _putWordsPico(self, words):
+        ar = ptr32(words)
+        for i in range(int(len(words))):
             self.sm.put(ar[i], 8)
 
+    # The DMA channel writes words to the state machine unshifted, so the buffer holds the GRB words already shifted into the top 24 bits
+    def _pushFrameDMA(self, frame):
+        n = len(frame)
+        if self._dmaBuffers is None or len(self._dmaBuffers[0]) != n:
+            self._dmaBuffers = (array.array("I", bytearray(4*n)), array.array("I", bytearray(4*n)))
+            self._dmaIndex = 0
+        buf = self._dmaBuffers[self._dmaIndex]
+        self._dmaIndex ^= 1
+        self._scaleFramePico(frame, buf, 0, n, 8)
+        dma = self._dmaChannel()
+        if dma is None:
+            self.sm.put(buf)
+            return
+        self._waitDMA()
+        dma.config(read=buf, write=self.sm, count=n, ctrl=self._dmaCtrl, trigger=True)
+
+    # Returns the DMA channel, claimed on first use, or None if rp2.DMA is unavailable or the state machine is simulated
+    def _dmaChannel(self):
+        if self._dma is None:
+            if not hasattr(rp2, "DMA") or isinstance(self.sm, simulatedStateMachine):
+                return None
+            self._dma = rp2.DMA()
+            # 32-bit reads from the buffer into the fixed TX FIFO address, paced by the state machine's TX data request (DREQ_PIO0_TX0 is 0, DREQ_PIO1_TX0 is 8)
+            smId = self._smId
+            self._dmaCtrl = self._dma.pack_ctrl(size=2, inc_write=False, treq_sel=(smId >> 2)*8 + (smId & 3))
+        return self._dma
+
+    # Waits for the frame being streamed to finish, then for the LEDs to latch it
+    def _waitDMA(self):
+        dma = self._dma
+        if dma is not None and dma.active():
+            while dma.active():
+                pass
+            time.sleep_us(self._latch_us)
+
     def _pixelsShowRPi(self):
-        self.__syncWait()
-        br = self.brightness
-        for i,c in enumerate(self.ar):
-            r = int((((int(c) >> 16) & 0xFF) * br) >> 8)
-            g = int((((int(c) >> 8) & 0xFF) * br) >> 8)
-            b = int(((int(c) & 0xFF) * br) >> 8)
-            self.strip.setPixelColor(i, (r<<16) | (g<<8) | b)
+        self._frameBegin()
+        self._syncWait()
+        self._showFrame(self._frame())
+        self._frameEnd()
+
+    def _pushFrameRPi(self, frame, lo, hi):
+        self._writeStripRPi(self._scaleFrame(frame, lo, hi), lo, hi)
         self.strip.show()
+
+    ## @brief Sends a frame buffer to the physical LEDs, unless it is identical to the last frame sent.
+    #
+    # A copy of the last frame sent is kept and compared against the new frame (a single memory comparison, not a Python loop). If neither the frame nor the brightness has changed the brightness scaling and hardware write are skipped. The FPS limiter still applies to skipped frames, so animation timing is unchanged.
+    #
+    # Set self.skipUnchangedFrames = False to always write every frame. The numbers of skipped and pushed frames are reported by frameStats().
+    #
+    # If self.dirtyTracking is True only the range of LEDs marked as changed since the last frame (see markDirty()) is rescaled and re-uploaded, and the comparison is skipped.
+    #
+    # \param frame An array("I") of 32-bit GlowBit colour values, usually self.ar
+    # \param lo The first changed LED index. If omitted the range is taken from, and then cleared in, the display's dirty range.
+    # \param hi One past the last changed LED index.
+
+    def _showFrame(self, frame, lo = None, hi = None):
+        if lo is None:
+            lo = self._dirtyLo
+            hi = self._dirtyHi
+            self._dirtyLo = self._DIRTY_MAX
+            self._dirtyHi = 0
+        N = len(frame)
+        if self.dirtyTracking == True and self.brightness == self._shownBrightness and len(self._shown_ar) == N:
+            hi = min(hi, N)
+            if lo >= hi:
+                self.framesSkipped += 1
+                return
+            self._copyRange(self._shown_ar, frame, lo, hi)
+        else:
+            lo = 0
+            hi = N
+            if self.skipUnchangedFrames == True and self.brightness == self._shownBrightness and frame == self._shown_ar:
+                self.framesSkipped += 1
+                return
+            if len(self._shown_ar) == N:
+                self._copyRange(self._shown_ar, frame, 0, N)
+            else:
+                self._shown_ar = array.array("I", frame)
+        self._shownBrightness = self.brightness
+        self.framesPushed += 1
+        self._pushFrame(frame, lo, hi)
+
+    ## @brief Copies src[lo:hi] into dst[lo:hi]. On the Pico this is a viper loop, as slicing allocates a slice object and a temporary array.
+
+    def _copyRange(self, dst, src, lo, hi):
+        if _SYSNAME == 'rp2':
+            self._copyRangePico(dst, src, lo, hi)
+        else:
+            dst[lo:hi] = src[lo:hi]
+
+    @micropython.viper
+    def _copyRangePico(self, dst, src, lo: int, hi: int):
+        d = ptr32(dst)
+        s = ptr32(src)
+        for i in range(lo, hi):
+            d[i] = s[i]
+
+    ## @brief Sets when pixelsShow() runs the garbage collector.
+    #
+    # The frame path of pixelsShow() does not allocate, so collections are only needed for the application's own allocations. Running them from pixelsShow(), after the frame has been sent, keeps them out of the middle of drawing. Allocations are measured with gc.mem_alloc(), so on CPython "Threshold" never collects.
+    #
+    # \param policy "Frames" collects every frames frames. "Threshold" collects once at least threshold bytes have been allocated since the last collection. "Manual" never collects; MicroPython still collects automatically when the heap is exhausted.
+    # \param frames The number of frames between collections with policy "Frames"
+    # \param threshold The number of bytes allocated since the last collection which triggers a collection with policy "Threshold"
+
+    def setGCPolicy(self, policy = "Threshold", frames = 1, threshold = 8192):
+        if policy not in ("Frames", "Threshold", "Manual"):
+            raise ValueError("Invalid GC policy: " + str(policy))
+        self.gcPolicy = policy
+        self.gcFrames = max(1, int(frames))
+        self.gcThreshold = int(threshold)
+        self._gcFrameCount = 0
+
+    # Called at the start of pixelsShow() to measure the allocations made while showing the frame
+    def _frameBegin(self):
+        if _gcMemAlloc is not None:
+            self._showAllocStart = _gcMemAlloc()
+
+    # Called at the end of pixelsShow(): records the allocations of the frame and runs the GC policy
+    def _frameEnd(self):
+        collect = False
+        if self.gcPolicy == "Frames":
+            self._gcFrameCount += 1
+            if self._gcFrameCount >= self.gcFrames:
+                self._gcFrameCount = 0
+                collect = True
+        if _gcMemAlloc is None:
+            if collect == True:
+                gc.collect()
+                self.gcCollections += 1
+            return
+        alloc = _gcMemAlloc()
+        self.showAllocBytes = alloc - self._showAllocStart
+        if self._allocMark is not None:
+            self.frameAllocBytes = alloc - self._allocMark
+        if self.gcPolicy == "Threshold" and alloc - self._gcBase >= self.gcThreshold:
+            collect = True
+        if collect == True:
+            gc.collect()
+            self.gcCollections += 1
+            alloc = _gcMemAlloc()
+            self._gcBase = alloc
+        self._allocMark = alloc
+
+    ## @brief Marks a range of LEDs as changed since the last frame was sent to the physical LEDs.
+    #
+    # This is only required when self.dirtyTracking is True and the internal buffer ar[] has been modified directly. All pixel drawing methods mark the LEDs they modify automatically.
+    #
+    # \param lo The first modified LED index. Defaults to 0.
+    # \param hi One past the last modified LED index. Defaults to the number of LEDs, ie: with no arguments the whole display is marked as changed.
+
+    def markDirty(self, lo = 0, hi = None):
+        if hi is None:
+            hi = self._DIRTY_MAX
+        if lo < self._dirtyLo:
+            self._dirtyLo = lo
+        if hi > self._dirtyHi:
+            self._dirtyHi = hi
+
+    ## @brief Forces the next call to pixelsShow() to write to the physical LEDs even if the internal buffer is unchanged.
+
+    def invalidateFrame(self):
+        self._shownBrightness = None
+
+    ## @brief Sends a frame buffer to the physical LEDs immediately, without waiting for the FPS limiter.
+    #
+    # \param frame An array("I") of 32-bit GlowBit colour values, usually self.ar
+    # \param lo The first LED index which needs to be rescaled and uploaded
+    # \param hi One past the last LED index which needs to be rescaled and uploaded
+
+    def _pushFrame(self, frame, lo, hi):
+        if self._multiChain is not None:
+            self._multiChain._pushDisplay(self, frame, lo, hi)
+        elif self.sm is not None:
+            self._pushFramePico(frame, lo, hi)
+        else:
+            self._pushFrameRPi(frame, lo, hi)
+
+    ## @brief Starts a background thread which scales and pushes frames to the physical LEDs.
+    #
+    # While the render thread is running pixelsShow() no longer blocks. It copies self.ar into a back buffer and returns immediately; the render thread swaps the back buffer with its front buffer at the next frame slot allowed by the FPS limiter and does the brightness scaling and LED output from the front buffer while the application draws the next frame.
+    #
+    # The front buffer is only ever touched by the render thread and the back buffer is only touched while holding a lock, so a partially drawn frame can never be displayed. If pixelsShow() is called more than once between frame slots only the newest frame is displayed.
+    #
+    # Note that because pixelsShow() returns immediately it no longer paces the application's drawing loop to the FPS limit.
+    #
+    # On the Raspberry Pi Pico the render thread runs on the second core.
+
+    def startRenderThread(self):
+        if self.renderThread == True:
+            return
+        import _thread
+        self._back_ar = array.array("I", self.ar)
+        self._front_ar = array.array("I", self.ar)
+        self._bufferLock = _thread.allocate_lock()
+        self._frameReady = _thread.allocate_lock()
+        self._frameReady.acquire()
+        self._renderDone = _thread.allocate_lock()
+        self._renderDone.acquire()
+        self._backDirtyLo = 0
+        self._backDirtyHi = self._DIRTY_MAX
+        self._pixelsShowUnbuffered = self.pixelsShow
+        self.pixelsShow = self._pixelsShowBuffered
+        self.renderThread = True
+        _thread.start_new_thread(self._renderLoop, ())
+
+    ## @brief Stops the background render thread started by startRenderThread() and restores the blocking pixelsShow().
+    #
+    # Returns once the render thread has finished any frame it was drawing. A frame posted with pixelsShow() which has not been drawn yet is discarded; call pixelsShow() again after this method to display it.
+
+    def stopRenderThread(self):
+        if self.renderThread == False:
+            return
+        self.renderThread = False
+        self.pixelsShow = self._pixelsShowUnbuffered
+        if self._frameReady.locked():
+            self._frameReady.release()
+        self._renderDone.acquire()
+
+    def _pixelsShowBuffered(self):
+        self._frameBegin()
+        with self._bufferLock:
+            frame = self._frame()
+            self._copyRange(self._back_ar, frame, 0, len(frame))
+            if self._dirtyLo < self._backDirtyLo:
+                self._backDirtyLo = self._dirtyLo
+            if self._dirtyHi > self._backDirtyHi:
+                self._backDirtyHi = self._dirtyHi
+            self._dirtyLo = self._DIRTY_MAX
+            self._dirtyHi = 0
+        if self._frameReady.locked():
+            self._frameReady.release()
+        self._frameEnd()
+
+    def _renderLoop(self):
+        try:
+            while True:
+                self._frameReady.acquire()
+                if self.renderThread == False:
+                    break
+                self._syncWait()
+                with self._bufferLock:
+                    front = self._back_ar
+                    self._back_ar = self._front_ar
+                    self._front_ar = front
+                    lo = self._backDirtyLo
+                    hi = self._backDirtyHi
+                    self._backDirtyLo = self._DIRTY_MAX
+                    self._backDirtyHi = 0
+                self._showFrame(front, lo, hi)
+        finally:
+            self._renderDone.release()
+
+    ## @brief Copies a scaled frame into the rpi_ws281x strip's LED data in a single operation.
+    #
+    # The fastest method the strip object supports is chosen the first time a frame is written and cached until self.strip changes:
+    # 1. A memmove() of the whole frame directly into the rpi_ws281x channel's LED buffer.
+    # 2. A single slice assignment to the LED data object returned by strip.getPixels().
+    # 3. One strip.setPixelColor() call per LED, for strip objects which expose neither of the above.
+    #
+    # \param frame An array("I") of scaled 32-bit colour values, as returned by _scaleFrame()
+    # \param lo The first LED index to write. Defaults to 0.
+    # \param hi One past the last LED index to write. Defaults to the length of frame.
+
+    def _writeStripRPi(self, frame, lo = 0, hi = None):
+        if hi is None:
+            hi = len(frame)
+        if self._stripWriterFor is not self.strip:
+            self._stripWriter = self._selectStripWriter()
+            self._stripWriterFor = self.strip
+        self._stripWriter(frame, lo, hi)
+
+    def _selectStripWriter(self):
+        strip = self.strip
+        n = len(self.ar)
+        try:
+            import ctypes
+            leds = ws.ws2811_channel_t_leds_get(strip._channel)
+            addr = int(leds)
+            if addr != 0 and int(strip.numPixels()) >= n:
+                def write(frame, lo, hi):
+                    ctypes.memmove(addr + 4*lo, frame.buffer_info()[0] + 4*lo, 4*(hi-lo))
+                return write
+        except Exception:
+            pass
+        try:
+            leds = strip.getPixels()
+            if len(leds) >= n and hasattr(leds, "__setitem__"):
+                def write(frame, lo, hi):
+                    leds[lo:hi] = frame[lo:hi]
+                return write
+        except Exception:
+            pass
+        def write(frame, lo, hi):
+            setPixelColor = strip.setPixelColor
+            for i in range(lo, hi):
+                setPixelColor(i, frame[i])
+        return write
    
-    def __syncWait(self):
-        while self.ticks_ms() < (self.lastFrame_ms + 1000 // self.rateLimit):
+    ## @brief Blocks until the next frame slot allowed by the FPS limiter.
+    #
+    # The calling thread sleeps for most of the remaining frame interval rather than spinning on ticks_ms(). If self.frameSpin_ms is greater than zero only the final frameSpin_ms milliseconds are busy-waited, which trades a little CPU time for tighter frame timing.
+
+    def _syncWait(self):
+        delay = self._frameDelay_ms()
+        if delay > self.frameSpin_ms:
+            self._sleep_ms(delay - self.frameSpin_ms)
+        deadline = self._frameDeadline_ms
+        while self.ticks_ms() < deadline:
             continue
-        self.lastFrame_ms = self.ticks_ms()
+        self._frameRelease()
+
+    ## @brief Returns the number of milliseconds until the next frame slot. Zero or negative if the slot has already passed.
+    #
+    # Frame slots are scheduled relative to the previous slot, not the time the previous frame was actually released, so sleep overshoot does not accumulate and the long-run frame rate matches rateLimit exactly.
+    #
+    # Slots are kept as whole milliseconds plus a remainder in units of 1/rateLimit ms, so no floats are created (floats are heap allocated on the Pico).
+
+    def _frameDelay_ms(self):
+        rate = self.rateLimit
+        if self._frameSlot_ms is None:
+            self._frameSlot_ms = self.lastFrame_ms
+            self._frameSlotFrac = 0
+        deadline = self._frameSlot_ms + 1000 // rate
+        frac = self._frameSlotFrac + 1000 % rate
+        if frac >= rate:
+            frac -= rate
+            deadline += 1
+        self._frameDeadline_ms = deadline
+        self._frameDeadlineFrac = frac
+        return deadline - self.ticks_ms()
+
+    ## @brief Records the release of a frame and updates the frame timing statistics.
+    #
+    # If a frame is released more than a whole frame interval after its slot the schedule is re-synchronised to the current time instead of trying to "catch up" with a burst of frames.
+
+    def _frameRelease(self):
+        now = self.ticks_ms()
+        rate = self.rateLimit
+        deadline = self._frameDeadline_ms
+        # More than one frame period (1000/rate ms) late
+        if (now - deadline)*rate > 1000:
+            self._frameSlot_ms = now
+            self._frameSlotFrac = 0
+        else:
+            self._frameSlot_ms = deadline
+            self._frameSlotFrac = self._frameDeadlineFrac
+        if now - deadline > 1:
+            self.lateFrames += 1
+        if self.frames > 0:
+            # The averages are kept in integer microseconds
+            interval = (now - self.lastFrame_ms)*1000
+            if self._frameInterval_us is None:
+                self._frameInterval_us = interval
+            self._frameInterval_us += (interval - self._frameInterval_us)//16
+            self._frameJitter_us += (abs(interval - 1000000//rate) - self._frameJitter_us)//16
+        self.frames += 1
+        self.lastFrame_ms = now
+
+    ## @brief Awaitable version of pixelsShow() for use with asyncio (or uasyncio on MicroPython).
+    #
+    # Instead of blocking the caller while the FPS limiter waits for the next frame slot this coroutine yields to the event loop, so other tasks (eg: other GlowBit displays or network servers) keep running. The frame is then pushed to the physical LEDs.
+    #
+    # Example:
+    # \code
+    # async def animate(display):
+    #     while True:
+    #         display.pixelsFill(display.wheel(display.frames % 255))
+    #         await display.pixelsShowAsync()
+    # \endcode
+
+    async def pixelsShowAsync(self):
+        if self.renderThread == True:
+            self.pixelsShow()
+            return
+        await self.waitFrameAsync()
+        self._frameBegin()
+        self._showFrame(self._frame())
+        self._frameEnd()
+
+    ## @brief Awaits the next frame slot of the FPS limiter without drawing anything.
+    #
+    # This is the event loop friendly frame clock used by pixelsShowAsync(). It can be used to pace work which should happen once per frame. Each call consumes a frame slot.
+
+    async def waitFrameAsync(self):
+        delay = self._frameDelay_ms()
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        self._frameRelease()
+
+    ## @brief Returns frame timing statistics gathered by the FPS limiter.
+    #
+    # \return A dictionary with the keys:
+    # - "fps": The achieved frame rate, averaged over roughly the last 16 frames.
+    # - "frames": The number of frames shown since the statistics were last reset.
+    # - "lateFrames": The number of frames released more than 1 ms after their scheduled slot.
+    # - "jitter_ms": The average absolute difference between the actual and the ideal frame interval, in milliseconds.
+    # - "framesSkipped": The number of frames which were not written to the LEDs because they were unchanged.
+    # - "framesPushed": The number of frames written to the LEDs.
+    # - "showAllocBytes": The number of bytes allocated by the last pixelsShow() call. On the Pico this is zero unless the frame composites layers or draws fed graphs. None where gc.mem_alloc() is unavailable (CPython).
+    # - "frameAllocBytes": The number of bytes allocated during the last whole frame, including the application's drawing. None where gc.mem_alloc() is unavailable. Negative if MicroPython collected garbage automatically during the frame.
+    # - "gcCollections": The number of garbage collections run by pixelsShow(). See setGCPolicy().
+
+    def frameStats(self):
+        if self._frameInterval_us:
+            fps = 1000000 / self._frameInterval_us
+        else:
+            fps = 0
+        return {"fps": fps, "frames": self.frames, "lateFrames": self.lateFrames, "jitter_ms": self._frameJitter_us / 1000, "framesSkipped": self.framesSkipped, "framesPushed": self.framesPushed, "showAllocBytes": self.showAllocBytes, "frameAllocBytes": self.frameAllocBytes, "gcCollections": self.gcCollections}
+
+    ## @brief Resets the statistics returned by frameStats()
+
+    def resetFrameStats(self):
+        self.frames = 0
+        self.lateFrames = 0
+        self.framesSkipped = 0
+        self.framesPushed = 0
+        self._frameInterval_us = None
+        self._frameJitter_us = 0
+        self.gcCollections = 0
+
+    def _sleep_ms(self, ms):
+        if _SYSNAME == 'rp2':
+            time.sleep_ms(int(ms))
+        else:
+            time.sleep(ms / 1000)
     
     def _ticks_ms_Linux(self):
-        return time.time()*1000
+        return time.monotonic()*1000
           
 
     ## @brief Pushes the internal pixel data buffer to the physical GlowBit LEDs
@@ -216,6 +1597,11 @@ class glowbit(colourFunctions, colourMaps):
     @micropython.viper
     def pixelSet(self, i: int, colour: int):
         self.ar[i] = colour
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
     
     ## @brief Sets the i'th GlowBit LED to a 32-bit GlowBit colour value and updates the physical LEDs.
     # 
@@ -227,6 +1613,11 @@ class glowbit(colourFunctions, colourMaps):
     @micropython.viper
     def pixelSetNow(self, i: int, colour: int):
         self.ar[i] = colour
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
         self.pixelsShow()
         
     ## @brief Adds a 32-bit GlowBit colour value to the i'th LED in the internal buffer only.
@@ -243,8 +1634,15 @@ class glowbit(colourFunctions, colourMaps):
     def pixelAdd(self, i: int, colour: int):
         tmp = int(self.ar[i]) + colour
         self.ar[i] = tmp
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
  
-    ## @brief Adds a 32-bit GlowBit colour value to the i'th LED in the internal buffer. This function performs "saturating" arithmetic. It is much slower than pixelAdd but will saturate at 255 to avoid data corruption.
+    ## @brief Adds a 32-bit GlowBit colour value to the i'th LED in the internal buffer. This function performs "saturating" arithmetic. It is slower than pixelAdd but will saturate at 255 to avoid data corruption.
+    #
+    # To add to many pixels at once see blendBuffer().
     #
     # NB: For efficiency, this method does not do any index bounds checking. If the value of the parameter i is larger than the number of LEDs it will cause an IndexError exception.
     #
@@ -255,27 +1653,190 @@ class glowbit(colourFunctions, colourMaps):
     @micropython.viper
     def pixelSaturatingAdd(self, i: int, colour: int):
         tmp = int(self.ar[i])
-        r = (colour & 0xFF0000) >> 16
-        g = (colour & 0x00FF00) >> 8
-        b = (colour & 0x0000FF)
-        
-        r2 = (tmp & 0xFF0000) >> 16
-        g2 = (tmp & 0x00FF00) >> 8
-        b2 = (tmp & 0x0000FF)
-
-        r3 = r + r2
-        g3 = g + g2
-        b3 = b + b2
-
-        if r3 > 255:
-            r3 = 255
-        if g3 > 255:
-            g3 = 255
-        if b3 > 255:
-            b3 = 255
-
-        self.ar[i] = (r3 << 16) + (g3 << 8) + b3
+        # Red and blue are added together, green separately; a carry out of a channel saturates it
+        rb = (tmp & 0xFF00FF) + (colour & 0xFF00FF)
+        g = (tmp & 0x00FF00) + (colour & 0x00FF00)
+        rb |= ((rb & 0x1000100) >> 8) * 0xFF
+        g |= ((g & 0x10000) >> 8) * 0xFF
+        self.ar[i] = (rb & 0xFF00FF) | (g & 0x00FF00)
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
            
+    ## @brief Blends a colour, or a run of colours, into the internal buffer in one pass.
+    #
+    # With NumPy the blend is a handful of vectorised array operations. Without NumPy the run of pixels is packed into a single big integer and blended with SWAR (SIMD within a register) arithmetic, so the cost grows with the number of pixels rather than the number of Python calls. "Multiply" with a run of colours is done pixel by pixel when NumPy is unavailable.
+    #
+    # \param src A packed 32-bit GlowBit colour which is blended into every pixel in [lo, hi), or a sequence of colours (array('I'), list or NumPy array) which is blended into the pixels starting at lo.
+    # \param mode "Add" adds with each colour channel saturating at 255, "Max" keeps the brighter of each channel, "Multiply" multiplies the channels (255 leaves a channel unchanged) and "Over" replaces the pixels.
+    # \param lo The index of the first pixel
+    # \param hi One past the index of the last pixel. Defaults to the end of the buffer.
+    # \param opacity The opacity of the blended result in the range [0,255]. Values below 255 mix the result with the pixels' previous colour, so mode "Over" with an opacity performs alpha blending.
+
+    def blendBuffer(self, src, mode = "Add", lo = 0, hi = None, opacity = 255):
+        ar = self.ar
+        if hi is None or hi > len(ar):
+            hi = len(ar)
+        if lo < 0:
+            lo = 0
+        if not isinstance(src, int) and lo + len(src) < hi:
+            hi = lo + len(src)
+        if hi <= lo:
+            return
+        _blendRun(ar, lo, hi, src, mode, opacity + (opacity >> 7))
+        self.markDirty(lo, hi)
+
+    ## @brief A layer of a display's layer stack. See addLayer().
+    #
+    # Each layer has its own buffer of 32-bit GlowBit colours, ar[], which is composited over the layers beneath it with a blend mode and opacity. Changing mode, opacity or visible causes the layer to be recomposited at the next pixelsShow().
+
+    class layer():
+        def __init__(self, ar, mode = "Add", opacity = 255):
+            ## The layer's buffer of 32-bit GlowBit colour values
+            self.ar = ar
+            self._acc = array.array("I", ar)
+            self._mode = mode
+            self._opacity = opacity
+            self._visible = True
+            self.dirtyLo = 0
+            self.dirtyHi = glowbit._DIRTY_MAX
+
+        def _getMode(self):
+            return self._mode
+
+        def _setMode(self, mode):
+            self._mode = mode
+            self.markDirty()
+
+        def _getOpacity(self):
+            return self._opacity
+
+        def _setOpacity(self, opacity):
+            self._opacity = opacity
+            self.markDirty()
+
+        def _getVisible(self):
+            return self._visible
+
+        def _setVisible(self, visible):
+            self._visible = visible
+            self.markDirty()
+
+        ## The blend mode used to composite the layer: "Add", "Max", "Multiply" or "Over". See blendBuffer().
+        mode = property(_getMode, _setMode)
+        ## The opacity of the layer in the range [0,255]
+        opacity = property(_getOpacity, _setOpacity)
+        ## If False the layer is not composited
+        visible = property(_getVisible, _setVisible)
+
+        ## @brief Marks a range of the layer as changed so it is recomposited at the next pixelsShow(). Drawing methods do this automatically for the layer selected with useLayer().
+
+        def markDirty(self, lo = 0, hi = None):
+            if hi is None:
+                hi = glowbit._DIRTY_MAX
+            if lo < self.dirtyLo:
+                self.dirtyLo = lo
+            if hi > self.dirtyHi:
+                self.dirtyHi = hi
+
+    ## @brief Adds a layer on top of the display's layer stack and returns it.
+    #
+    # Layers let independent widgets (eg: scrolling text over a graph) draw to their own buffers, so clearing one widget does not erase the others. The display's original buffer is the bottom of the stack. At each pixelsShow() the layers are blended, bottom to top, into an output buffer which is sent to the LEDs.
+    #
+    # Only the range of pixels modified since the last frame is recomposited, starting from the lowest layer which changed; the composite of the unchanged layers beneath it is kept from the previous frame. Single pixel writes are only recorded when dirtyTracking is True; otherwise the layer selected with useLayer() is recomposited in full at every pixelsShow().
+    #
+    # Use useLayer() to choose which layer the drawing methods draw to. With mode "Add" (the default) or "Max", black pixels in a layer are transparent.
+    #
+    # \param mode The blend mode used to composite the layer: "Add", "Max", "Multiply" or "Over". See blendBuffer().
+    # \param opacity The opacity of the layer in the range [0,255]
+    # \return The new layer. Its buffer is initially blank.
+
+    def addLayer(self, mode = "Add", opacity = 255):
+        if len(self.layers) == 0:
+            self.layers = []
+            self._baseLayer = self.layer(self.ar)
+            self._baseLayer._acc = self.ar
+            self._activeLayer = self._baseLayer
+        newLayer = self.layer(array.array("I", [0 for _ in range(len(self._baseLayer.ar))]), mode, opacity)
+        self.layers.append(newLayer)
+        return newLayer
+
+    ## @brief Removes a layer from the display's layer stack. If it was selected with useLayer() drawing returns to the base buffer.
+
+    def removeLayer(self, layer):
+        if self._activeLayer is layer:
+            self.useLayer()
+        self.layers.remove(layer)
+        self._baseLayer.markDirty()
+
+    ## @brief Selects the layer which the drawing methods draw to.
+    #
+    # The internal buffer ar[] refers to the selected layer's buffer, so every drawing method (and direct writes to ar[]) modify that layer only.
+    #
+    # \param layer A layer returned by addLayer(), or None for the display's base buffer.
+
+    def useLayer(self, layer = None):
+        if len(self.layers) == 0:
+            return
+        if layer is None:
+            layer = self._baseLayer
+        # The pending dirty range belongs to the layer being left. Single pixel writes are only recorded with dirtyTracking, so without it the whole layer is marked.
+        if self.dirtyTracking:
+            self._activeLayer.markDirty(self._dirtyLo, self._dirtyHi)
+        else:
+            self._activeLayer.markDirty()
+        self._dirtyLo = self._DIRTY_MAX
+        self._dirtyHi = 0
+        self._activeLayer = layer
+        self.ar = layer.ar
+
+    ## @brief Returns the frame to be shown: the internal buffer, or the composite of the layer stack if layers have been added.
+
+    def _frame(self):
+        if len(self._pendingGraphs) > 0:
+            self._drawPendingGraphs()
+        if len(self.layers) == 0:
+            return self.ar
+        return self._compositeLayers()
+
+    ## @brief Recomposites the changed part of the layer stack and sets the display's dirty range to the pixels which changed.
+
+    def _compositeLayers(self):
+        if self.dirtyTracking:
+            self._activeLayer.markDirty(self._dirtyLo, self._dirtyHi)
+        else:
+            self._activeLayer.markDirty()
+        N = len(self.ar)
+        lo = self._DIRTY_MAX
+        hi = 0
+        below = self._baseLayer._acc
+        for k in range(-1, len(self.layers)):
+            if k < 0:
+                L = self._baseLayer
+            else:
+                L = self.layers[k]
+            if L.dirtyLo < lo:
+                lo = L.dirtyLo
+            if L.dirtyHi > hi:
+                hi = min(L.dirtyHi, N)
+            L.dirtyLo = self._DIRTY_MAX
+            L.dirtyHi = 0
+            if k >= 0 and lo < hi:
+                acc = L._acc
+                acc[lo:hi] = below[lo:hi]
+                if L._visible == True and L._opacity > 0:
+                    _blendRun(acc, lo, hi, memoryview(L.ar)[lo:hi], L._mode, L._opacity + (L._opacity >> 7))
+            below = L._acc
+        if lo < hi:
+            self._dirtyLo = lo
+            self._dirtyHi = hi
+        else:
+            self._dirtyLo = self._DIRTY_MAX
+            self._dirtyHi = 0
+        return below
+
     ## @brief Fills all pixels with a solid colour value
     #
     # \param colour The 32-bit GlowBit colour value
@@ -285,6 +1846,7 @@ class glowbit(colourFunctions, colourMaps):
         ar = self.ar
         for i in range(int(len(self.ar))):
             ar[i] = colour
+        self.markDirty()
             
     ## @brief Fills all pixels with a solid colour value and updates the physical LEDs.
     #
@@ -295,6 +1857,7 @@ class glowbit(colourFunctions, colourMaps):
         ar = ptr32(self.ar)
         for i in range(int(len(self.ar))):
             ar[i] = colour
+        self.markDirty()
         self.pixelsShow()
         
     ## @brief Blanks the entire GlowBit display. ie: sets the colour value of all GlowBit LEDs to zero in the internal buffer and updates the physical LEDs.
@@ -306,6 +1869,7 @@ class glowbit(colourFunctions, colourMaps):
         ar = self.ar
         for i in range(int(len(self.ar))):
             ar[i] = 0
+        self.markDirty()
         self.pixelsShow()
   
 
@@ -332,6 +1896,44 @@ class glowbit(colourFunctions, colourMaps):
             self.brightness = int(brightness*255)
         else:
             self.brightness = int(brightness)
+        self._buildBrightnessLUT()
+
+    ## @brief Rebuilds the 256 entry brightness lookup table used to scale the internal buffer before it is drawn to the physical LEDs.
+    #
+    # The same table is applied to the red, green, and blue channels. This is called by updateBrightness() and only needs to be called manually if self.brightness is modified directly.
+
+    def _buildBrightnessLUT(self):
+        br = min(max(int(self.brightness), 0), 255)
+        self._brightnessLUT = bytes([(v*br) >> 8 for v in range(256)])
+        if numpy is not None:
+            self._brightnessLUT_np = numpy.frombuffer(self._brightnessLUT, dtype=numpy.uint8)
+        self._lutBrightness = self.brightness
+
+    ## @brief Applies the brightness lookup table to every channel of a packed 32-bit colour buffer in a single batched pass.
+    #
+    # NumPy is used when it is available, otherwise the buffer is scaled with bytes.translate() on a byte view of the array. Neither method loops over pixels in Python.
+    #
+    # \param ar An array("I") of 32-bit GlowBit colour values, usually self.ar
+    # \param lo The first LED index to scale. Defaults to 0.
+    # \param hi One past the last LED index to scale. Defaults to the length of ar. LEDs outside [lo,hi) keep the scaled value from the previous call.
+    # \return An array("I") of scaled colour values. The returned array is reused by the next call.
+
+    def _scaleFrame(self, ar, lo = 0, hi = None):
+        if hi is None:
+            hi = len(ar)
+        if self._lutBrightness != self.brightness:
+            self._buildBrightnessLUT()
+        scaled = self._scaled_ar
+        if len(scaled) != len(ar):
+            scaled = array.array("I", bytes(4*len(ar)))
+            self._scaled_ar = scaled
+            lo = 0
+            hi = len(ar)
+        if numpy is not None:
+            numpy.take(self._brightnessLUT_np, numpy.frombuffer(ar, dtype=numpy.uint8)[4*lo:4*hi], out=numpy.frombuffer(scaled, dtype=numpy.uint8)[4*lo:4*hi])
+        else:
+            memoryview(scaled).cast("B")[4*lo:4*hi] = bytes(memoryview(ar).cast("B")[4*lo:4*hi]).translate(self._brightnessLUT)
+        return scaled
 
     ## @brief Calculates an estimate for the total power draw given the current display data. Use as a general guide only, error range is around 10-20%.
     #
@@ -358,6 +1960,7 @@ class glowbit(colourFunctions, colourMaps):
         while iters > 0:
             for i in range(int(self.numLEDs)):
                 ar[i] = int(random.randint(0, 0xFFFFFF))
+            self.markDirty()
             self.pixelsShow()
             iters -= 1
         self.blankDisplay()
@@ -368,6 +1971,76 @@ class glowbit(colourFunctions, colourMaps):
 
 class glowbitMatrix(glowbit):
 
+    ## The glyph cache shared by all matrix displays. Holds the decoded bitmaps of the most recently drawn characters of every font; its size can be changed with glyphCache.resize().
+    glyphCache = lruCache(64)
+
+    def _getRemap(self):
+        return self._remapFunction
+
+    def _setRemap(self, mapFunction):
+        self._remapFunction = mapFunction
+        self._buildRemapTable()
+
+    ## @brief The pixel mapping function which maps an (x,y) coordinate to an index in the internal buffer, eg: remap8x8() or a custom mapFunction.
+    #
+    # Assigning a new mapping function (eg: matrix.remap = myMapFunction) rebuilds the lookup table used by all of the x-y drawing methods. The mapping function is only called once per pixel when it is assigned, so custom mapping functions are as fast as the built-in ones.
+
+    remap = property(_getRemap, _setRemap)
+
+    ## @brief Builds the (x,y) to buffer index lookup table from the current mapping function.
+    #
+    # The table is a flat array indexed by y*numLEDsX + x. It only needs to be called manually if the mapping function's behaviour changes without a new function being assigned to remap.
+
+    def _buildRemapTable(self):
+        remap = self._remapFunction
+        if self.numLEDs <= 0x10000:
+            typecode = "H"
+        else:
+            typecode = "I"
+        self._remapTable = array.array(typecode, [remap(x,y) for y in range(self.numLEDsY) for x in range(self.numLEDsX)])
+        self._remapTable_np = None
+        self._buildRemapRuns()
+        self._remapIdentity = True
+        for i in range(len(self._remapTable)):
+            if self._remapTable[i] != i:
+                self._remapIdentity = False
+                break
+
+    ## @brief Splits each row of the x-y lookup table into runs of consecutive buffer indices.
+    #
+    # self._remapRuns[y] is a list of (xStart, xStop, index) tuples: the pixels (x,y) for x in range(xStart, xStop) are stored at buffer indices index + x - xStart. The runs allow rectangular regions to be drawn with slice operations.
+
+    def _buildRemapRuns(self):
+        table = self._remapTable
+        W = self.numLEDsX
+        runs = []
+        count = 0
+        for y in range(self.numLEDsY):
+            row = []
+            base = y*W
+            x = 0
+            while x < W:
+                start = x
+                i0 = table[base + x]
+                x += 1
+                while x < W and table[base + x] == i0 + x - start:
+                    x += 1
+                row.append((start, x, i0))
+            runs.append(row)
+            count += len(row)
+        self._remapRuns = runs
+        # Layouts with an average run length under 4 pixels are drawn with NumPy gathers if available.
+        self._remapScattered = count*4 > self.numLEDs
+
+    def _remapTableNumpy(self):
+        if self._remapTable_np is None:
+            if self._remapTable.typecode == "H":
+                dtype = numpy.uint16
+            else:
+                dtype = numpy.uint32
+            self._remapTable_np = numpy.frombuffer(self._remapTable, dtype=dtype).reshape(self.numLEDsY, self.numLEDsX)
+        return self._remapTable_np
+
     ## @brief Sets the colour value of the GlowBit LED at a given x-y coordinate
     #
     # The coordinate assumes an origin in the upper left of the display with x increasing to the right and y increasing downwards.
@@ -382,9 +2055,16 @@ class glowbitMatrix(glowbit):
 
     @micropython.viper
     def pixelSetXY(self, x: int, y: int, colour: int):
-        x = x % int(self.numLEDsX)
+        W = int(self.numLEDsX)
+        x = x % W
         y = y % int(self.numLEDsY)
-        self.ar[int(self.remap(x,y))] = colour
+        i = int(self._remapTable[y*W + x])
+        self.ar[i] = colour
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
    
     ## @brief Sets the colour value of the GlowBit LED at a given x-y coordinate and immediately calls pixelsShow() to update the physical LEDs.
     #
@@ -400,10 +2080,16 @@ class glowbitMatrix(glowbit):
 
     @micropython.viper
     def pixelSetXYNow(self, x: int, y: int, colour: int):
-        x = x % int(self.numLEDsX)
+        W = int(self.numLEDsX)
+        x = x % W
         y = y % int(self.numLEDsY)
-        i = int(self.remap(x,y))
-        self.ar[i % int(self.numLEDs)] = colour
+        i = int(self._remapTable[y*W + x]) % int(self.numLEDs)
+        self.ar[i] = colour
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
         self.pixelsShow()
     
     ## @brief Sets the colour value of the GlowBit LED at a given x-y coordinate
@@ -418,8 +2104,15 @@ class glowbitMatrix(glowbit):
  
     @micropython.viper
     def pixelSetXYClip(self, x: int, y: int, colour: int):
-        if x >= 0 and y >= 0 and x < int(self.numLEDsX) and y < int(self.numLEDsY):
-            self.ar[int(self.remap(x,y))] = colour
+        W = int(self.numLEDsX)
+        if x >= 0 and y >= 0 and x < W and y < int(self.numLEDsY):
+            i = int(self._remapTable[y*W + x])
+            self.ar[i] = colour
+            if self.dirtyTracking:
+                if i < int(self._dirtyLo):
+                    self._dirtyLo = i
+                if i >= int(self._dirtyHi):
+                    self._dirtyHi = i + 1
 
     ## @brief Adds the colour value to the GlowBit LED at a given (x,y) coordinate
     #
@@ -435,10 +2128,16 @@ class glowbitMatrix(glowbit):
 
     @micropython.viper
     def pixelAddXY(self, x: int, y: int, colour: int):
-        x = x % int(self.numLEDsX)
+        W = int(self.numLEDsX)
+        x = x % W
         y = y % int(self.numLEDsY)
-        i = int(self.remap(x,y))
+        i = int(self._remapTable[y*W + x])
         self.ar[i] = int(self.ar[i]) + colour
+        if self.dirtyTracking:
+            if i < int(self._dirtyLo):
+                self._dirtyLo = i
+            if i >= int(self._dirtyHi):
+                self._dirtyHi = i + 1
 
     ## @brief Adds the colour value to the GlowBit LED at a given (x,y) coordinate
     #
@@ -454,8 +2153,15 @@ class glowbitMatrix(glowbit):
 
     @micropython.viper
     def pixelAddXYClip(self, x: int, y: int, colour: int):
-        if x >= 0 and y >= 0 and x < int(self.numLEDsX) and y < int(self.numLEDsY):
-            self.ar[int(self.remap(x,y))] = colour + int(self.ar[int(self.remap(x,y))])
+        W = int(self.numLEDsX)
+        if x >= 0 and y >= 0 and x < W and y < int(self.numLEDsY):
+            i = int(self._remapTable[y*W + x])
+            self.ar[i] = colour + int(self.ar[i])
+            if self.dirtyTracking:
+                if i < int(self._dirtyLo):
+                    self._dirtyLo = i
+                if i >= int(self._dirtyHi):
+                    self._dirtyHi = i + 1
    
     ## @brief Returns the 32-bit GlowBit colour value of the LED at a given (x,y) coordinate
     #
@@ -465,7 +2171,182 @@ class glowbitMatrix(glowbit):
     # \return The 32-bit GlowBit colour value of the i'th LED
 
     def getPixelXY(self, x, y):
-        return self.ar[self.remap(x,y)]
+        return self.ar[self._remapTable[y*self.numLEDsX + x]]
+
+    ## @brief Copies a two dimensional block of colours to the display with its upper left corner at (x,y).
+    #
+    # The block can be a NumPy array with shape (H,W) containing packed 32-bit GlowBit colour values or shape (H,W,3) containing 8-bit red, green, and blue values. With NumPy the block is scattered into the internal buffer through the x-y lookup table in a single vectorised operation.
+    #
+    # If NumPy is not available the block can be a list of rows (or any indexable equivalent) where each element is either a packed 32-bit GlowBit colour value or an (R,G,B) tuple.
+    #
+    # Parts of the block falling outside the display's boundary are clipped.
+    #
+    # By default the block replaces the pixels beneath it. Passing a blend mode composites the block onto the display instead, eg: for sprites drawn over a background.
+    #
+    # \param array2d The block of colours to draw. Rows are indexed first, ie: array2d[y][x].
+    # \param x The x coordinate of the block's upper left corner
+    # \param y The y coordinate of the block's upper left corner
+    # \param mode None to copy the block, or one of the blendBuffer() modes "Add", "Max", "Multiply" or "Over"
+    # \param opacity The opacity of the block in the range [0,255] when a blend mode is given
+
+    def blit(self, array2d, x = 0, y = 0, mode = None, opacity = 255):
+        if numpy is not None:
+            src = numpy.asarray(array2d)
+            if src.ndim == 3:
+                src = (src[:,:,0].astype(numpy.uint32) << 16) | (src[:,:,1].astype(numpy.uint32) << 8) | src[:,:,2].astype(numpy.uint32)
+            h = src.shape[0]
+            w = src.shape[1]
+        else:
+            src = array2d
+            h = len(src)
+            if h == 0:
+                return
+            w = len(src[0])
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x+w, self.numLEDsX)
+        y1 = min(y+h, self.numLEDsY)
+        if x0 >= x1 or y0 >= y1:
+            return
+        alpha = opacity + (opacity >> 7)
+        if numpy is not None:
+            idx = self._remapTableNumpy()[y0:y1, x0:x1]
+            ar = numpy.frombuffer(self.ar, dtype=numpy.uint32)
+            block = src[y0-y:y1-y, x0-x:x1-x].astype(numpy.uint32)
+            if mode is None:
+                ar[idx] = block
+            else:
+                ar[idx] = _blendColours(ar[idx], block, mode, alpha)
+            self.markDirty(int(idx.min()), int(idx.max())+1)
+            return
+        ar = self.ar
+        table = self._remapTable
+        W = self.numLEDsX
+        for row in range(y0, y1):
+            srcRow = src[row-y]
+            base = row*W
+            for col in range(x0, x1):
+                c = srcRow[col-x]
+                if not isinstance(c, int):
+                    c = (int(c[0]) << 16) | (int(c[1]) << 8) | int(c[2])
+                i = table[base+col]
+                if mode is not None:
+                    c = _blendColours(ar[i], c, mode, alpha)
+                ar[i] = c
+                if self.dirtyTracking:
+                    if i < int(self._dirtyLo):
+                        self._dirtyLo = i
+                    if i >= int(self._dirtyHi):
+                        self._dirtyHi = i + 1
+
+    ## @brief Returns the contents of the internal buffer arranged in x-y order, ie: element [y][x] is the colour of the LED at (x,y).
+    #
+    # With NumPy this returns an array of shape (numLEDsY, numLEDsX) of packed 32-bit GlowBit colour values. If the mapping function is the identity (the buffer is already stored row by row) this is a zero-copy view of the internal buffer, so writes to it change the display (call markDirty() afterwards if dirtyTracking is enabled). Otherwise the pixels must be reordered and a copy is returned; use blit() to write it back.
+    #
+    # Without NumPy a list of array("I") rows is returned (always a copy).
+    #
+    # \return The display's colour values in x-y order
+
+    def asarray(self):
+        H = self.numLEDsY
+        W = self.numLEDsX
+        if numpy is not None:
+            ar = numpy.frombuffer(self.ar, dtype=numpy.uint32)
+            if self._remapIdentity == True:
+                return ar[:W*H].reshape(H, W)
+            return ar[self._remapTableNumpy()]
+        ar = self.ar
+        table = self._remapTable
+        return [array.array("I", [ar[table[y*W + x]] for x in range(W)]) for y in range(H)]
+
+    ## @brief Draw a single character to the display
+    #
+    # Each character's bitmap is decoded once into a list of lit pixels and kept in a glyph cache (see glyphCache), so drawing a character only touches the pixels which are lit.
+    #
+    # The character's colour is added to the pixels already in the internal buffer, with each colour channel saturating at 255. Characters not in the font are not drawn.
+    #
+    # See also: addTextScroll() / updateTextScroll() for built-in scrolling text and printTextWrap() for printing static text with automatic line feeds.
+    #
+    # \param char A single character string. This character will be drawn to the internal buffer.
+    # \param Px The x coordinate of the upper left corner of the character.
+    # \param Py The y coordinate of the upper left corner of the character.
+    # \param colour A 32-bit GlowBit colour value
+    # \param font The font to draw with: a bitmapFont, the name of a registered font (eg: "3x5") or None for the 8x8 petme128 font.
+
+    def drawChar(self, char, Px, Py, colour, font = None):
+        font = getFont(font)
+        W = self.numLEDsX
+        H = self.numLEDsY
+        if Px <= -font.width or Px >= W or Py <= -font.height or Py >= H:
+            return
+        glyph = self._glyph(char, font)
+        ar = self.ar
+        table = self._remapTable
+        lo = self._DIRTY_MAX
+        hi = 0
+        for (col, row) in glyph:
+            x = Px + col
+            y = Py + row
+            if x >= 0 and x < W and y >= 0 and y < H:
+                i = table[y*W + x]
+                ar[i] = _saturatingAdd(ar[i], colour)
+                if i < lo:
+                    lo = i
+                if i >= hi:
+                    hi = i + 1
+        self.markDirty(lo, hi)
+
+    ## @brief Returns a character's glyph as a tuple of lit (column, row) pixel offsets, decoding it from the font on a glyph cache miss.
+
+    def _glyph(self, char, font):
+        key = (font, char)
+        glyph = self.glyphCache.get(key)
+        if glyph is None:
+            lit = []
+            columns = font.columns(char)
+            if columns is not None:
+                for col in range(len(columns)):
+                    dat = columns[col]
+                    for row in range(font.height):
+                        if (dat >> row) & 1:
+                            lit.append((col, row))
+            glyph = tuple(lit)
+            self.glyphCache.put(key, glyph)
+        return glyph
+
+    ## @brief Prints a string of text to the display, automatically wrapping to new lines as required.
+    #
+    # Characters which do not fit on the display are truncated. Lines which do not fit below the previous line are not drawn, unless the font is taller than the display (eg: the 3x5 font on a GlowBit Matrix 4x4) in which case the bottom of the glyphs is clipped.
+    #
+    # \param string The string to print to the display.
+    # \param x The x coordinate of the upper left corner of the first character
+    # \param y The y coordinate of the upper left corner of the first character
+    # \param colour A 32-bit GlowBit colour value. All pixels in every character will be drawn in this colour.
+    # \param font The font to print with: a bitmapFont, the name of a registered font (eg: "3x5") or None for the 8x8 petme128 font.
+    # \param proportional If True the text is packed tightly, each character only taking up the width of its lit columns plus a gap. See bitmapFont.render().
+
+    def printTextWrap(self, string, x = 0, y = 0, colour = 0xFFFFFF, font = None, proportional = False):
+        font = getFont(font)
+        Px = x
+        Py = y
+        lastRow = self.numLEDsY - min(font.height, self.numLEDsY)
+        gap = font._gap()
+        for char in string:
+            if proportional:
+                (left, width) = font.metrics(char)
+                if Py <= lastRow:
+                    self.drawChar(char, Px - left, Py, colour, font)
+                Px += width + gap
+            else:
+                if Py <= lastRow:
+                    self.drawChar(char, Px, Py, colour, font)
+                Px += font.advance(char)
+            if Px + 1 >= self.numLEDsX:
+                Py += font.height + font.spacing
+                if x < 0:
+                    Px = 0
+                else:
+                    Px = x
 
     ## @brief Draws a straight line between (x0,y0) and (x1,y1) in the specified 32-bit GlowBit colour.
     #
@@ -560,7 +2441,9 @@ class glowbitMatrix(glowbit):
     #
     # This method overwrites pixel data with the colour value.
     #
-    # If pixel is drawn off the screen a "clipping" effect will be inherited from the behaviour of pixelSetXYClip(). ie: Pixels landing off the screen will not be drawn.
+    # Pixels drawn off the screen "wrap-around" in the same way as pixelSetXY().
+    #
+    # The rectangle is drawn one contiguous span of the internal buffer at a time, so rows of a GlowBit Matrix module are filled with a single slice assignment rather than one pixel at a time.
     #
     # \param x0 The x coordinate of the upper left corner
     # \param y0 The y coordinate of the upper left corner
@@ -568,17 +2451,32 @@ class glowbitMatrix(glowbit):
     # \param y1 The y coordinate of the lower right corner
     # \param colour A packed 32-bit GlowBit colour value
 
-    @micropython.viper
-    def drawRectangleFill(self, x0: int, y0: int, x1: int, y1: int, colour):
-        for x in range(x0, x1+1):
-            for y in range(y0, y1+1):
-                self.pixelSetXY(x,y,colour)
+    def drawRectangleFill(self, x0, y0, x1, y1, colour):
+        if numpy is not None and self._remapScattered == True:
+            self._rectangleNumpy(x0, y0, x1, y1, colour, 0)
+            return
+        runs = self._rectangleRuns(x0, y0, x1, y1)
+        if len(runs) == 0:
+            return
+        ar = memoryview(self.ar)
+        fill = memoryview(array.array("I", [colour]*self.numLEDsX))
+        lo = self._DIRTY_MAX
+        hi = 0
+        for (a, b, count) in runs:
+            ar[a:b] = fill[0:b-a]
+            if a < lo:
+                lo = a
+            if b > hi:
+                hi = b
+        self.markDirty(lo, hi)
 
     ## @brief Draws a rectangle with upper-left corner (x0,y0) and lower right corner (x1, y1). The rectangle is then filled to form a solid block of the specified colour.
     #
     # This method adds a colour to every pixel, allowing a rectangle to be drawn over the top of other pixel data.
     #
-    # If pixel is drawn off the screen a "clipping" effect will be inherited from the behaviour of pixelSetXYClip(). ie: Pixels landing off the screen will not be drawn.
+    # Pixels drawn off the screen "wrap-around" in the same way as pixelAddXY().
+    #
+    # Data colour corruption will occur if the sum result of any RGB value exceeds 255. See drawRectangleFillSaturatingAdd() for a version which avoids this.
     #
     # \param x0 The x coordinate of the upper left corner
     # \param y0 The y coordinate of the upper left corner
@@ -586,11 +2484,115 @@ class glowbitMatrix(glowbit):
     # \param y1 The y coordinate of the lower right corner
     # \param colour A packed 32-bit GlowBit colour value
 
-    @micropython.viper
-    def drawRectangleFillAdd(self, x0: int, y0: int, x1: int, y1: int, colour):
-        for x in range(x0, x1+1):
-            for y in range(y0, y1+1):
-                self.pixelAddXY(x,y,colour)
+    def drawRectangleFillAdd(self, x0, y0, x1, y1, colour):
+        if numpy is not None and self._remapScattered == True:
+            self._rectangleNumpy(x0, y0, x1, y1, colour, 1)
+            return
+        ar = self.ar
+        lo = self._DIRTY_MAX
+        hi = 0
+        for (a, b, count) in self._rectangleRuns(x0, y0, x1, y1):
+            c = colour*count
+            for i in range(a, b):
+                ar[i] += c
+            if a < lo:
+                lo = a
+            if b > hi:
+                hi = b
+        self.markDirty(lo, hi)
+
+    ## @brief Draws a rectangle with upper-left corner (x0,y0) and lower right corner (x1, y1). The colour is added to every pixel inside the rectangle with "saturating" arithmetic.
+    #
+    # Like drawRectangleFillAdd() this allows a rectangle to be drawn over the top of other pixel data, but each colour channel saturates at 255 instead of overflowing into its neighbour.
+    #
+    # Pixels drawn off the screen "wrap-around" in the same way as pixelAddXY().
+    #
+    # \param x0 The x coordinate of the upper left corner
+    # \param y0 The y coordinate of the upper left corner
+    # \param x1 The x coordinate of the lower right corner
+    # \param y1 The y coordinate of the lower right corner
+    # \param colour A packed 32-bit GlowBit colour value
+
+    def drawRectangleFillSaturatingAdd(self, x0, y0, x1, y1, colour):
+        if numpy is not None and self._remapScattered == True:
+            self._rectangleNumpy(x0, y0, x1, y1, colour, 2)
+            return
+        ar = self.ar
+        lo = self._DIRTY_MAX
+        hi = 0
+        for (a, b, count) in self._rectangleRuns(x0, y0, x1, y1):
+            c = _scaleColourSaturating(colour, count)
+            for i in range(a, b):
+                ar[i] = _saturatingAdd(ar[i], c)
+            if a < lo:
+                lo = a
+            if b > hi:
+                hi = b
+        self.markDirty(lo, hi)
+
+    ## @brief Splits the range [a,b] of coordinates into spans on a display n pixels wide, with the same wrap-around as pixelSetXY().
+    #
+    # \return A list of (start, stop, count) tuples. Each coordinate in range(start, stop) is covered count times; count is greater than 1 when the range is wider than the display.
+
+    def _wrapSpans(self, a, b, n):
+        length = b - a + 1
+        if length <= 0:
+            return []
+        k = length // n
+        r = length % n
+        if r == 0:
+            return [(0, n, k)]
+        start = a % n
+        stop = start + r
+        if stop <= n:
+            rem = [(start, stop)]
+        else:
+            rem = [(0, stop - n), (start, n)]
+        spans = [(s, e, k + 1) for (s, e) in rem]
+        if k > 0:
+            prev = 0
+            for (s, e) in rem:
+                if s > prev:
+                    spans.append((prev, s, k))
+                prev = e
+            if prev < n:
+                spans.append((prev, n, k))
+        return spans
+
+    ## @brief Converts the rectangle (x0,y0)-(x1,y1) into runs of consecutive buffer indices using the precomputed row runs of the x-y lookup table.
+    #
+    # \return A list of (lo, hi, count) tuples; the buffer indices in range(lo, hi) are covered count times.
+
+    def _rectangleRuns(self, x0, y0, x1, y1):
+        runs = []
+        colSpans = self._wrapSpans(x0, x1, self.numLEDsX)
+        for (ys, ye, cy) in self._wrapSpans(y0, y1, self.numLEDsY):
+            for y in range(ys, ye):
+                for (rx0, rx1, i0) in self._remapRuns[y]:
+                    for (xs, xe, cx) in colSpans:
+                        a = max(xs, rx0)
+                        b = min(xe, rx1)
+                        if a < b:
+                            runs.append((i0 + a - rx0, i0 + b - rx0, cx*cy))
+        return runs
+
+    ## @brief Fills, adds or saturating-adds a colour to a rectangle using NumPy index gathers through the x-y lookup table. Used for mapping functions which do not store rows contiguously.
+    #
+    # \param mode 0 to fill, 1 to add, 2 to add with saturation
+
+    def _rectangleNumpy(self, x0, y0, x1, y1, colour, mode):
+        ar = numpy.frombuffer(self.ar, dtype=numpy.uint32)
+        table = self._remapTableNumpy()
+        for (ys, ye, cy) in self._wrapSpans(y0, y1, self.numLEDsY):
+            for (xs, xe, cx) in self._wrapSpans(x0, x1, self.numLEDsX):
+                idx = table[ys:ye, xs:xe]
+                if mode == 0:
+                    ar[idx] = colour
+                elif mode == 1:
+                    ar[idx] += numpy.uint32(colour*cx*cy)
+                else:
+                    ar[idx] = _saturatingAdd(ar[idx], numpy.uint32(_scaleColourSaturating(colour, cx*cy)))
+                self.markDirty(int(idx.min()), int(idx.max())+1)
 
     ## @brief Draws a circle with center (x0,y0) and radius r. The circle's outline is drawn in the specified colour. Pixels inside the circle are not modified.
     # 
@@ -697,21 +2699,22 @@ class glowbitMatrix(glowbit):
     def updateGraph1D(self, graph, value):
         N = round(graph.m*(value - graph.minValue))
 
-        m = graph.colourMap
         if graph.orientation == 1:
+            lut = graph.colourMapTable(graph.originY, graph.length, graph.inc, graph.originY, graph.originY+(graph.inc*graph.length-1))
             n = 0
             for idxY in range(graph.originY, graph.originY+graph.inc*(graph.length), graph.inc):
                 if n < N:
-                    self.pixelSetXY(graph.originX, idxY, m(idxY, graph.originY, graph.originY+(graph.inc*graph.length-1)))
+                    self.pixelSetXY(graph.originX, idxY, lut[n])
                 else:
                     self.pixelSetXY(graph.originX, idxY, 0)
                 n += 1
 
         if graph.orientation == 0:
+            lut = graph.colourMapTable(graph.originX, graph.length, graph.inc, graph.originX, graph.originX+(graph.inc*graph.length-1))
             n = 0
             for idxX in range(graph.originX, graph.originX+graph.inc*(graph.length), graph.inc):
                 if n < N:
-                    self.pixelSetXY(idxX, graph.originY, m(idxX, graph.originX, graph.originX+(graph.inc*graph.length-1)))
+                    self.pixelSetXY(idxX, graph.originY, lut[n])
                 else:
                     self.pixelSetXY(idxX, graph.originY, 0)
                 n += 1
@@ -739,8 +2742,12 @@ class glowbitMatrix(glowbit):
         # \param bgColour A packed 32-bit GlowBit colour value which is drawn to the entire graph area prior to drawing the data.
         # \param colourMap Either the string "Solid" or "Rainbow" or a pointer to a custom colour map function. Custom colour maps must take the parameters colourMap(self, index, minIndex, maxIndex).
         # \param update If update=True then a call to updateGraph2D() will, in turn, call glowbit.pixelsShow() to update the physical LEDs.
+        # \param bars If True each value is drawn as a bar from the bottom edge rather than a single point.
+        # \param incremental If True updateGraph2D() scrolls the pixels already drawn one column to the left and only draws the new value, instead of redrawing the whole graph. This is much faster for wide graphs but assumes nothing else draws over the graph's area (eg: draw other widgets on a separate layer, see addLayer()).
+        # \param samplesPerColumn The number of samples passed to feedGraph2D() which are reduced into each column of the graph.
+        # \param reduce How feedGraph2D() reduces each column's samples to a value: "Last", "Min", "Max", "Mean" or "MinMax". "MinMax" draws each column as a vertical span from the smallest to the largest sample.
 
-        def __init__(self, originX = 0, originY = 7, width = 8, height = 8, minValue=0, maxValue=255, colour = 0xFFFFFF, bgColour = 0x000000, colourMap = "Solid", update = False, bars = False):
+        def __init__(self, originX = 0, originY = 7, width = 8, height = 8, minValue=0, maxValue=255, colour = 0xFFFFFF, bgColour = 0x000000, colourMap = "Solid", update = False, bars = False, incremental = False, samplesPerColumn = 1, reduce = "Last"):
             self.minValue = minValue
             self.maxValue = maxValue
             self.originX = originX
@@ -753,8 +2760,25 @@ class glowbitMatrix(glowbit):
             self.m = (-height)/(maxValue-minValue)
             self.offset = originY+self.m*minValue
             self.bars = bars
+            self.incremental = incremental
             
-            self.data = []
+            # The most recent values are kept in a ring buffer of width slots along with the row each is drawn at
+            self._values = [0]*width
+            self._ys = array.array("i", [0]*width)
+            self._head = width - 1
+            self._count = 0
+            self._ysKey = None
+            self._drawn = False
+            # Columns added since the graph was last drawn
+            self._pending = 0
+            self._layer = None
+
+            self.samplesPerColumn = samplesPerColumn
+            self.reduce = reduce
+            if reduce == "MinMax":
+                self._lows = [0]*width
+                self._ysLow = array.array("i", [0]*width)
+            self._bucketCount = 0
             
             if callable(colourMap) == True:
                 self.colourMap = colourMap
@@ -762,32 +2786,273 @@ class glowbitMatrix(glowbit):
                 self.colourMap = self.colourMapSolid
             elif colourMap == "Rainbow":
                 self.colourMap = self.colourMapRainbow
+
+        def _getData(self):
+            width = self.width
+            return [self._values[(self._head - k) % width] for k in range(self._count)]
+
+        def _setData(self, data):
+            self._count = 0
+            for value in reversed(data[:self.width]):
+                self._push(value)
+            self._drawn = False
+
+        ## The values drawn on the graph, newest first. Assigning a list replaces the graph's values.
+        data = property(_getData, _setData)
+
+        def _row(self, value):
+            return round(-self.height/(self.maxValue-self.minValue )*(value - self.minValue) + self.originY + 1)
+
+        def _push(self, value, low = None):
+            self._head = (self._head + 1) % self.width
+            self._values[self._head] = value
+            self._ys[self._head] = self._row(value)
+            if self.reduce == "MinMax":
+                if low is None:
+                    low = value
+                self._lows[self._head] = low
+                self._ysLow[self._head] = self._row(low)
+            if self._count < self.width:
+                self._count += 1
+
+        ## @brief Reduces samples into column buckets, pushing each completed bucket into the ring buffer.
+
+        def _feed(self, samples):
+            n = self.samplesPerColumn
+            reduce = self.reduce
+            count = self._bucketCount
+            if count > 0:
+                lo = self._bucketMin
+                hi = self._bucketMax
+                total = self._bucketSum
+            for v in samples:
+                if count == 0:
+                    lo = v
+                    hi = v
+                    total = v
+                else:
+                    if v < lo:
+                        lo = v
+                    if v > hi:
+                        hi = v
+                    total += v
+                count += 1
+                if count >= n:
+                    if reduce == "Last":
+                        self._push(v)
+                    elif reduce == "Min":
+                        self._push(lo)
+                    elif reduce == "Max":
+                        self._push(hi)
+                    elif reduce == "Mean":
+                        self._push(total/count)
+                    else:
+                        self._push(hi, lo)
+                    self._pending += 1
+                    count = 0
+            self._bucketCount = count
+            if count > 0:
+                self._bucketMin = lo
+                self._bucketMax = hi
+                self._bucketSum = total
+
+        ## @brief Recomputes the cached rows of all values if the graph's scale or position has changed since they were computed.
+
+        def _checkRows(self):
+            key = (self.minValue, self.maxValue, self.height, self.originY)
+            if key != self._ysKey:
+                for k in range(self.width):
+                    self._ys[k] = self._row(self._values[k])
+                    if self.reduce == "MinMax":
+                        self._ysLow[k] = self._row(self._lows[k])
+                self._ysKey = key
+                self._drawn = False
     
     ## @brief Updates a 2D graph with a new value.
+    #
+    # Values are stored in a ring buffer along with the row they are drawn at, so adding a value does not shift or rescale the graph's history. If the graph was created with incremental=True the graph's pixels are scrolled left in bulk and only the new value is drawn.
+    #
+    # To add samples faster than the display's frame rate use feedGraph2D() instead.
     # 
     # \param graph A graph2D object created graph2D
     # \param value A new value to draw to the graph. This value will be drawn on the right edge and the oldest value will be deleted.
 
     def updateGraph2D(self, graph, value):
-        graph.data.insert(0,value)
-        if len(graph.data) > graph.width:
-            graph.data.pop()
-        x = graph.originX+graph.width-1
-        m = graph.colourMap
-        self.drawRectangleFill(graph.originX, graph.originY-graph.height+1, graph.originX+graph.width-1, graph.originY, graph.bgColour)
-        for value in graph.data:
-            y = round(-graph.height/(graph.maxValue-graph.minValue )*(value - graph.minValue) + graph.originY + 1)
-            if graph.bars == True:
-                for idx in range(y, graph.originY+1):
-                    if x >= graph.originX and x < graph.originX+graph.width and idx <= graph.originY and idx > graph.originY-graph.height:
-                        self.pixelSet(self.remap(x,idx), m(idx, graph.originY, graph.originY+graph.height-1))
-            else:
-                if x >= graph.originX and x < graph.originX+graph.width and y <= graph.originY and y > graph.originY-graph.height:
-                    self.pixelSet(self.remap(x,y), m(y - graph.originY, graph.originY, graph.originY+graph.height-1))
-            x -= 1
+        graph._push(value)
+        graph._pending += 1
+        self.drawGraph2D(graph)
         if graph.update == True:
             self.pixelsShow()
 
+    ## @brief Adds any number of samples to a 2D graph without drawing it.
+    #
+    # Samples are reduced into columns of graph.samplesPerColumn samples each, using the graph's reduce method ("Last", "Min", "Max", "Mean" or "MinMax"). Samples of an incomplete column are kept until the column is completed by a later call.
+    #
+    # The graph is not drawn by this method. Graphs with new columns are drawn once, just before the next frame is sent by pixelsShow(), so the drawing cost depends on the display's frame rate rather than the rate samples arrive. Call drawGraph2D() to draw the graph immediately.
+    #
+    # If layers are in use the graph is drawn to the layer selected when this method is called.
+    #
+    # With NumPy, arrays of samples are reduced with vectorised operations and only the columns which will still be visible are computed.
+    #
+    # \param graph A graph2D object
+    # \param samples A single value or an iterable of values, eg: a list, array, NumPy array or generator.
+
+    def feedGraph2D(self, graph, samples):
+        if isinstance(samples, (int, float)):
+            samples = (samples,)
+        if numpy is not None and isinstance(samples, numpy.ndarray) and samples.ndim == 1:
+            self._feedGraph2DNumpy(graph, samples)
+        else:
+            graph._feed(samples)
+        if graph._pending > 0 and not graph in self._pendingGraphs:
+            if len(self._pendingGraphs) == 0:
+                self._pendingGraphs = []
+            if len(self.layers) > 0:
+                graph._layer = self._activeLayer
+            self._pendingGraphs.append(graph)
+
+    def _feedGraph2DNumpy(self, graph, samples):
+        n = graph.samplesPerColumn
+        # Complete a partly filled column first
+        head = 0
+        if graph._bucketCount > 0:
+            head = min(n - graph._bucketCount, len(samples))
+            graph._feed(samples[:head].tolist())
+        columns = (len(samples) - head) // n
+        # Columns which would scroll straight off the graph are skipped
+        skip = max(columns - graph.width, 0)
+        body = samples[head + skip*n:head + columns*n].reshape(-1, n)
+        if len(body) > 0:
+            if graph.reduce == "Last":
+                values = body[:, -1]
+            elif graph.reduce == "Min":
+                values = body.min(axis=1)
+            elif graph.reduce == "Max" or graph.reduce == "MinMax":
+                values = body.max(axis=1)
+            else:
+                values = body.mean(axis=1)
+            if graph.reduce == "MinMax":
+                for (v, low) in zip(values.tolist(), body.min(axis=1).tolist()):
+                    graph._push(v, low)
+            else:
+                for v in values.tolist():
+                    graph._push(v)
+            graph._pending += columns
+        graph._feed(samples[head + columns*n:].tolist())
+
+    ## @brief Draws a 2D graph's columns added since it was last drawn.
+    #
+    # With incremental=True the graph is scrolled left by the number of new columns and only the new columns are drawn; otherwise the whole graph is redrawn.
+    #
+    # \param graph A graph2D object
+
+    def drawGraph2D(self, graph):
+        graph._checkRows()
+        k = graph._pending
+        if k == 0 and graph._drawn == True:
+            return
+        graph._pending = 0
+        x0 = graph.originX
+        x1 = graph.originX+graph.width-1
+        y0 = graph.originY-graph.height+1
+        if graph.incremental == True and graph._drawn == True and k < graph.width:
+            self._scrollRectLeft(x0, y0, x1, graph.originY, k)
+            self.drawRectangleFill(x1-k+1, y0, x1, graph.originY, graph.bgColour)
+            count = k
+        else:
+            self.drawRectangleFill(x0, y0, x1, graph.originY, graph.bgColour)
+            count = graph._count
+            graph._drawn = True
+        # Bars are coloured by row, points by their offset from the origin
+        if graph.bars == True or graph.reduce == "MinMax":
+            lut = graph.colourMapTable(y0, graph.height, 1, graph.originY, graph.originY+graph.height-1)
+        else:
+            lut = graph.colourMapTable(1-graph.height, graph.height, 1, graph.originY, graph.originY+graph.height-1)
+        x = x1
+        slot = graph._head
+        for _ in range(count):
+            self._drawGraph2DColumn(graph, x, slot, lut)
+            slot -= 1
+            if slot < 0:
+                slot = graph.width - 1
+            x -= 1
+
+    ## @brief Draws the graphs fed with feedGraph2D() since the last frame. Called when a frame is shown.
+
+    def _drawPendingGraphs(self):
+        graphs = self._pendingGraphs
+        self._pendingGraphs = []
+        for graph in graphs:
+            if graph._layer is not None and len(self.layers) > 0:
+                active = self._activeLayer
+                self.useLayer(graph._layer)
+                self.drawGraph2D(graph)
+                self.useLayer(active)
+            else:
+                self.drawGraph2D(graph)
+
+    ## @brief Draws the value held in ring buffer slot of a 2D graph at column x.
+
+    def _drawGraph2DColumn(self, graph, x, slot, lut):
+        W = self.numLEDsX
+        table = self._remapTable
+        y = graph._ys[slot]
+        if x < graph.originX or x >= graph.originX+graph.width:
+            return
+        if graph.bars == True or graph.reduce == "MinMax":
+            bottom = graph.originY
+            if graph.bars == False:
+                bottom = min(graph._ysLow[slot], bottom)
+            top = graph.originY-graph.height+1
+            for idx in range(max(y, top), bottom+1):
+                self.pixelSet(table[idx*W + x], lut[idx - top])
+        elif y <= graph.originY and y > graph.originY-graph.height:
+            self.pixelSet(table[y*W + x], lut[y - graph.originY + graph.height - 1])
+
+    ## @brief Moves the pixels of the rectangle (x0,y0)-(x1,y1) n columns to the left. The leftmost n columns are discarded and the rightmost n columns keep their colours.
+    #
+    # If rows are split into more than two runs of consecutive buffer indices (eg: tiled displays) and NumPy is available the whole rectangle is moved with a single gather and scatter through the x-y lookup table. Otherwise each row is moved with one slice copy per run of consecutive buffer indices in the lookup table (see _remapRuns), plus single pixel copies where a row crosses from one run to the next.
+
+    def _scrollRectLeft(self, x0, y0, x1, y1, n = 1):
+        x0 = max(x0, 0)
+        x1 = min(x1, self.numLEDsX-1)
+        y0 = max(y0, 0)
+        y1 = min(y1, self.numLEDsY-1)
+        if x1 - x0 < n or y0 > y1:
+            return
+        if numpy is not None and len(self._remapRuns[y0]) > 2:
+            idx = self._remapTableNumpy()[y0:y1+1, x0:x1+1]
+            ar = numpy.frombuffer(self.ar, dtype=numpy.uint32)
+            ar[idx[:, :-n]] = ar[idx[:, n:]]
+            self.markDirty(int(idx.min()), int(idx.max())+1)
+            return
+        ar = self.ar
+        W = self.numLEDsX
+        table = self._remapTable
+        lo = self._DIRTY_MAX
+        hi = 0
+        last = x1 - n
+        for y in range(y0, y1+1):
+            for (rx0, rx1, i0) in self._remapRuns[y]:
+                # Destination columns a..b of this run; sources up to rx1-1 lie in the same run
+                a = max(rx0, x0)
+                b = min(rx1-1, last)
+                if a > b:
+                    continue
+                i = i0 + a - rx0
+                inRun = min(b, rx1-1-n) - a + 1
+                if inRun > 0:
+                    ar[i:i+inRun] = ar[i+n:i+n+inRun]
+                else:
+                    inRun = 0
+                for x in range(a + inRun, b + 1):
+                    ar[i0 + x - rx0] = ar[table[y*W + x + n]]
+                if i < lo:
+                    lo = i
+                if i0 + b - rx0 >= hi:
+                    hi = i0 + b - rx0 + 1
+        self.markDirty(lo, hi)
+
     ## @brief Demonstrate drawing an animated line
 
     def lineDemo(self, iters = 10):
@@ -977,11 +3242,13 @@ class stick(glowbit):
     # \param brightness The relative brightness of the LEDs. Colours drawn to the internal buffer should be in the range [0,255] and the brightness parameter scales this value before drawing to the physical display. If brightness is an integer it should be in the range [0,255]. If brightness is floating point it is assumed to be in the range [0,1.0].
     # \param rateLimitFPS The maximum frame rate of the display in frames per second. The pixelsShow() function blocks to enforce this limit.
     # \param sm (Raspberry Pi Pico only) The PIO state machine to generate the GlowBit data stream. Each connected GlowBit display chain requires a unique state machine. Valid values are in the range [0,7].
+    # \param maxPulses The maximum number of pulses on the stick at once. If set, the pulse pool and its arrays are allocated when the stick is created and addPulse() adds no pulse while the pool is full. Defaults to None (no limit; the pool grows to the largest number of pulses used).
 
-    def __init__(self, numLEDs = 8, pin = 18, brightness = 20, rateLimitFPS = 30, sm = 0):
+    def __init__(self, numLEDs = 8, pin = 18, brightness = 20, rateLimitFPS = 30, sm = 0, maxPulses = None):
         if _SYSNAME == 'rp2':
             self.sm = rp2.StateMachine(sm, self._ws2812, freq=8_000_000, sideset_base=Pin(pin))
             self.sm.active(1)
+            self._smId = sm
             self.pixelsShow = self._pixelsShowPico
             self.ticks_ms = time.ticks_ms
 
@@ -1002,20 +3269,40 @@ class stick(glowbit):
         else:
             self.rateLimit = 100
         
-        if brightness <= 1.0 and isinstance(brightness, float):
-            self.brightness = int(brightness*255)
-        else:
-            self.brightness = int(brightness)
+        self.updateBrightness(brightness)
         
         self.pixelsFill(0)
         self.pixelsShow()
         
         # The list of pulses which are drawn upon a call 
         self.pulses = []
+        ## The maximum number of pulses on the stick at once, or None for no limit
+        self.maxPulses = maxPulses
+        # Position (index * 100), speed and width of each pulse; slot k belongs to self.pulses[k] for k < _pulseCount
+        self._pulsePositions = array.array("i")
+        self._pulseSpeeds = array.array("i")
+        self._pulseWidths = array.array("i")
+        self._pulseCount = 0
+        self._pulseLayout = None
+        # The list the pulse arrays were built for, to detect when self.pulses is replaced or modified directly
+        self._pulseList = self.pulses
+        # Pulse objects which have left the stick, reused by addPulse()
+        self._freePulses = []
+        if maxPulses is not None:
+            # The whole pool is allocated up front
+            self._pulsePositions = array.array("i", bytearray(4*maxPulses))
+            self._pulseSpeeds = array.array("i", bytearray(4*maxPulses))
+            self._pulseWidths = array.array("i", bytearray(4*maxPulses))
+            self._freePulses = [self.pulse() for _ in range(maxPulses)]
 
     ## @brief A class for animating "pulses" which move down a GlowBit stick.
+    #
+    # Once a pulse is added to a stick with addPulse() its position and speed live in the stick's pulse arrays and the index and speed attributes read and write those arrays.
+    #
+    # Pulse objects are pooled: when a pulse leaves the stick it is returned to the stick's free list and is reused by a later addPulse() call, so a pulse should not be used after it has left the stick.
 
     class pulse(colourFunctions, colourMaps):
+        __slots__ = ("_stick", "_slot", "_speed", "_position", "colour", "colourMap", "_mapName", "_tableKey", "_colourTables")
 
         ## @brief Initialisation routine for the GlowBit Stick pulse object.
         #
@@ -1027,11 +3314,17 @@ class stick(glowbit):
         # \param colourMap Either the string "Solid" or "Rainbow" or a custom function pointer. Custom functions must take the positional arguments: colourMapFunction(self, index, minIndex, maxIndex). When calling colour map functions updatePulses() sets minIndex to 0 and maxIndex to numLEDs.
 
         def __init__(self, speed = 100, colour = [0xFFFFFF], index = 0, colourMap = None):
-            ## Speed of the pulse
-            self.speed = speed 
-            ## Initial index of the pulse
-            self.index = index
-            self._position = self.index*100 # index * 100
+            # The stick whose pulse arrays hold this pulse's position and speed, and the pulse's slot in them
+            self._stick = None
+            self._slot = -1
+            self._mapName = None
+            self._colourTables = None
+            self._reset(speed, colour, index, colourMap)
+
+        # Sets up the pulse for (re)use; takes the same arguments as __init__()
+        def _reset(self, speed, colour, index, colourMap):
+            self._speed = int(speed)
+            self._position = int(index*100) # index * 100
            
             if type(colour) is list:
                 ## A list of 32-bit GlowBit colour values. Each one is drawn to a pixel; a -1 indicates the use of the colourMap function
@@ -1039,54 +3332,378 @@ class stick(glowbit):
             else:
                 self.colour = [colour]
 
+            ## Key under which pulses with the same colour map share a colour map table, or None if the colour map depends on the pulse
+            self._tableKey = None
             if callable(colourMap) == True:
                 ## Either the string "Solid" or "Rainbow" or a function pointer to a custom colourmap. Only sets pixel colour for pixels with a colour of -1.
                 self.colourMap = colourMap
+                self._tableKey = colourMap
+                self._mapName = None
             elif colourMap == "Solid":
-                self.colourMap = self.colourMapSolid
+                # A reused pulse keeps its bound method rather than allocating a new one
+                if self._mapName != "Solid":
+                    self.colourMap = self.colourMapSolid
+                    self._mapName = "Solid"
             elif colourMap == "Rainbow":
-                self.colourMap = self.colourMapRainbow
+                if self._mapName != "Rainbow":
+                    self.colourMap = self.colourMapRainbow
+                    self._mapName = "Rainbow"
+                self._tableKey = "Rainbow"
             else:
                 self.colourMap = None
-            
+                self._mapName = None
+
+        ## Speed of the pulse
+        @property
+        def speed(self):
+            if self._stick is None:
+                return self._speed
+            return self._stick._pulseSpeeds[self._slot]
+
+        @speed.setter
+        def speed(self, speed):
+            if self._stick is None:
+                self._speed = int(speed)
+            else:
+                self._stick._pulseSpeeds[self._slot] = int(speed)
+
+        ## Current index of the pulse; the pixel its first colour is drawn to
+        @property
+        def index(self):
+            if self._stick is None:
+                return self._position//100
+            return self._stick._pulsePositions[self._slot]//100
+
+        @index.setter
+        def index(self, index):
+            if self._stick is None:
+                self._position = int(index*100)
+            else:
+                self._stick._pulsePositions[self._slot] = int(index*100)
+
         def _update(self):
-            self._position += self.speed
-            self.index = self._position//100
+            if self._stick is None:
+                self._position += self._speed
+            else:
+                self._stick._pulsePositions[self._slot] += self._stick._pulseSpeeds[self._slot]
+
+        # Copies the position and speed out of the stick's pulse arrays when the pulse is removed from them
+        def _detach(self):
+            stick = self._stick
+            if stick is not None:
+                self._position = stick._pulsePositions[self._slot]
+                self._speed = stick._pulseSpeeds[self._slot]
+                self._stick = None
+                self._slot = -1
+
+    ## Pulses at least this many pixels long are drawn with a single blendBuffer() call
+    pulseBlendRun = 16
+
+    ## With NumPy, updatePulses() draws the pulses with one batched saturating add once there are at least this many
+    pulseBatchMin = 32
+
+    _pulseTables = None
 
     ## @brief Add a pulse to the list of pulses    
     #
+    # The pulse object is taken from the stick's free list of pulses which have left the stick when there is one, so steady state animations do not allocate new pulse objects. If maxPulses pulses are already on the stick no pulse is added.
+    #
+    # The pulse's colour list is read whenever pulses are drawn with NumPy after the set of pulses changes, so a pulse's colours should not be modified after it has been added.
+    #
     # \param speed The speed of the pulse in units of (pixels moved per frame) * 100. A value of 100 means the pulse will move 1 pixels per frame. A speed of 1 will move a pulse 1 pixel every 100 frames. Speed can be positive or negative to allow pulses to move in either direction.
     # \param colour A list of 32-bit GlowBit colours for the pulse. The pulse will have a width equal to the number of elements in this list. A list entry of -1 will have the colour set by a colour map function.
     # \param index The initial index of the pulse. Generally recommended to set to 0 if speed > 0 and numLEDs if speed < 0.
     # \param colourMap Either the string "Solid" or "Rainbow" or a custom function pointer. Custom functions must take the positional arguments: colourMapFunction(self, index, minIndex, maxIndex). When calling colour map functions updatePulses() sets minIndex to 0 and maxIndex to numLEDs.
+    # \return The pulse object, or None if the stick already has maxPulses pulses
 
     def addPulse(self, speed = 100, colour = [0xFFFFFF], index = 0, colourMap = None):
-        self.pulses.append(self.pulse(speed, colour, index, colourMap))
-    
+        if self.pulses is not self._pulseList or len(self.pulses) != self._pulseCount:
+            self._syncPulses()
+        if self.maxPulses is not None and self._pulseCount >= self.maxPulses:
+            return None
+        if len(self._freePulses) > 0:
+            p = self._freePulses.pop()
+            p._reset(speed, colour, index, colourMap)
+        else:
+            p = self.pulse(speed, colour, index, colourMap)
+        self._attachPulse(p)
+        return p
+
+    # Puts a pulse in the next free slot of the pulse arrays. The arrays only grow; slots past _pulseCount are unused.
+    def _attachPulse(self, p):
+        n = self._pulseCount
+        if n == len(self._pulsePositions):
+            self._pulsePositions.append(p._position)
+            self._pulseSpeeds.append(p._speed)
+            self._pulseWidths.append(len(p.colour))
+        else:
+            self._pulsePositions[n] = p._position
+            self._pulseSpeeds[n] = p._speed
+            self._pulseWidths[n] = len(p.colour)
+        p._slot = n
+        p._stick = self
+        self.pulses.append(p)
+        self._pulseCount = n + 1
+        self._pulseLayout = None
+
+    # Rebuilds the pulse arrays from self.pulses after the list has been modified directly, eg: self.pulses = []. Pulses which are no longer in the list go to the free list.
+    def _syncPulses(self):
+        pulses = list(self.pulses)
+        listed = set([id(p) for p in pulses])
+        for p in self._pulseList:
+            if p._stick is self:
+                p._detach()
+                if id(p) not in listed:
+                    self._freePulses.append(p)
+        for p in pulses:
+            if p._stick is not None:
+                p._detach()
+        del self.pulses[:]
+        self._pulseList = self.pulses
+        self._pulseCount = 0
+        for p in pulses:
+            self._attachPulse(p)
 
     ## @brief Update the position of all pulses in self.pulses[] and draw them to the internal buffer.
     #
+    # Pulse positions, speeds and widths are kept in arrays (a structure of arrays) so all pulses are advanced and the pulses which have left the stick are removed in one pass. With NumPy and at least pulseBatchMin pulses the pulses are drawn with a single batched saturating add, and advanced and culled with array operations.
+    #
     # A call to pixelsShow() must be done manually to update the physical LEDs.
 
     def updatePulses(self):
-        for p in self.pulses:
-            i = p.index
-            for c in p.colour:
+        if self.pulses is not self._pulseList or len(self.pulses) != self._pulseCount:
+            self._syncPulses()
+        if self._pulseCount == 0:
+            return
+        if numpy is not None and self._pulseCount >= self.pulseBatchMin:
+            self._drawPulsesNumpy()
+            self._advancePulsesNumpy()
+        else:
+            positions = self._pulsePositions
+            pulses = self.pulses
+            for k in range(self._pulseCount):
+                self._drawPulse(pulses[k], positions[k]//100)
+            self._advancePulses()
+
+    # Draws one pulse whose first colour is at pixel index
+    def _drawPulse(self, p, index):
+        # The colour map table is only looked up once a pulse has a pixel with a colour of -1
+        lut = False
+        # Long pulses are blended into the buffer as one run of pixels; for short ones per-pixel adds are cheaper
+        if len(p.colour) >= self.pulseBlendRun:
+            lo = max(index - len(p.colour) + 1, 0)
+            hi = min(index + 1, self.numLEDs)
+            run = []
+            for i in range(lo, hi):
+                c = p.colour[index - i]
                 if c == -1:
-                    if callable(p.colourMap):
+                    if lut is False:
+                        lut = self._pulseColourTable(p)
+                    if lut is not None:
+                        c = lut[i]
+                    elif callable(p.colourMap):
                         c = p.colourMap(i, 0, self.numLEDs)
                     else:
                         c = 0
-                if i >=0 and i < self.numLEDs:
-                    self.pixelSaturatingAdd(i, c)
-                i -= 1
-            p._update()
-            
-        for p in reversed(self.pulses):
-            if p.index - len(p.colour) >= self.numLEDs:
-                self.pulses.remove(p)
-            if p.index + len(p.colour) < 0:
-                self.pulses.remove(p)
+                run.append(c)
+            self.blendBuffer(run, "Add", lo)
+            return
+        i = index
+        for c in p.colour:
+            if i >=0 and i < self.numLEDs:
+                if c == -1:
+                    if lut is False:
+                        lut = self._pulseColourTable(p)
+                    if lut is not None:
+                        c = lut[i]
+                    elif callable(p.colourMap):
+                        c = p.colourMap(i, 0, self.numLEDs)
+                    else:
+                        c = 0
+                self.pixelSaturatingAdd(i, c)
+            i -= 1
+
+    # Advances every pulse by its speed and removes the pulses which have left the stick, compacting the arrays in place. Removed pulses go to the free list.
+    def _advancePulses(self):
+        positions = self._pulsePositions
+        speeds = self._pulseSpeeds
+        widths = self._pulseWidths
+        pulses = self.pulses
+        free = self._freePulses
+        N = self.numLEDs
+        n = self._pulseCount
+        j = 0
+        for k in range(n):
+            position = positions[k] + speeds[k]
+            positions[k] = position
+            index = position//100
+            w = widths[k]
+            if index - w >= N or index + w < 0:
+                p = pulses[k]
+                p._detach()
+                free.append(p)
+                continue
+            if j != k:
+                positions[j] = position
+                speeds[j] = speeds[k]
+                widths[j] = w
+                p = pulses[k]
+                pulses[j] = p
+                p._slot = j
+            j += 1
+        if j < n:
+            del pulses[j:]
+            self._pulseCount = j
+            self._pulseLayout = None
+
+    # NumPy version of _advancePulses()
+    def _advancePulsesNumpy(self):
+        n = self._pulseCount
+        positions = numpy.frombuffer(self._pulsePositions, dtype=numpy.int32)[:n]
+        speeds = numpy.frombuffer(self._pulseSpeeds, dtype=numpy.int32)[:n]
+        widths = numpy.frombuffer(self._pulseWidths, dtype=numpy.int32)[:n]
+        positions += speeds
+        index = positions//100
+        gone = (index - widths >= self.numLEDs) | (index + widths < 0)
+        if not gone.any():
+            return
+        pulses = self.pulses
+        free = self._freePulses
+        for k in numpy.flatnonzero(gone).tolist():
+            p = pulses[k]
+            p._detach()
+            free.append(p)
+        keep = numpy.flatnonzero(~gone)
+        m = len(keep)
+        positions[:m] = positions[keep]
+        speeds[:m] = speeds[keep]
+        widths[:m] = widths[keep]
+        kept = [pulses[k] for k in keep.tolist()]
+        for j in range(m):
+            kept[j]._slot = j
+        pulses[:] = kept
+        self._pulseCount = m
+        self._pulseLayout = None
+
+    # Flattens the colours of all pulses into NumPy arrays; rebuilt only when the set of pulses changes.
+    # Pixels with a colour of -1 index a stack of the shared colour map tables. Pulses whose colour map has no shared table are drawn with _drawPulse().
+    def _pulseLayoutNumpy(self):
+        N = self.numLEDs
+        pulses = self.pulses
+        colours = []
+        tableRows = []
+        tables = []
+        tableIds = {}
+        direct = []
+        batched = numpy.ones(len(pulses), dtype=bool)
+        for k in range(len(pulses)):
+            p = pulses[k]
+            row = -1
+            if -1 in p.colour:
+                lut = self._pulseColourTable(p)
+                if lut is not None:
+                    row = tableIds.get(id(lut))
+                    if row is None:
+                        row = len(tables)
+                        tableIds[id(lut)] = row
+                        tables.append(numpy.frombuffer(lut, dtype=numpy.uint32))
+                elif callable(p.colourMap):
+                    direct.append(p)
+                    batched[k] = False
+            colours.extend(p.colour)
+            tableRows.append(row)
+        widths = numpy.frombuffer(self._pulseWidths, dtype=numpy.int32)[:len(pulses)]
+        owner = numpy.repeat(numpy.arange(len(pulses)), widths)
+        starts = numpy.cumsum(widths) - widths
+        offsets = numpy.arange(len(colours)) - starts[owner]
+        colours = numpy.array(colours, dtype=numpy.int64)
+        mapped = colours == -1
+        rows = numpy.array(tableRows, dtype=numpy.int64)[owner]
+        # Colour map pixels of pulses without a colour map are drawn black
+        colours[mapped & (rows < 0)] = 0
+        mapped &= rows >= 0
+        keep = batched[owner]
+        if len(tables) > 0:
+            tables = numpy.concatenate(tables)
+        else:
+            tables = None
+        layout = (owner[keep], offsets[keep], colours[keep], mapped[keep], rows[keep]*N, tables, direct)
+        self._pulseLayout = layout
+        return layout
+
+    # Draws all pulses with one saturating add per channel: the contributions to each pixel are summed with bincount and the sums are added to the buffer, saturating at 255.
+    # As every contribution is non-negative this gives the same result as adding the pulses one at a time.
+    def _drawPulsesNumpy(self):
+        layout = self._pulseLayout
+        if layout is None:
+            layout = self._pulseLayoutNumpy()
+        owner, offsets, colours, mapped, tableBase, tables, direct = layout
+        N = self.numLEDs
+        index = numpy.frombuffer(self._pulsePositions, dtype=numpy.int32)[:self._pulseCount]//100
+        pix = index[owner] - offsets
+        valid = (pix >= 0) & (pix < N)
+        pix = pix[valid]
+        c = colours[valid]
+        if tables is not None:
+            m = mapped[valid]
+            c[m] = tables[tableBase[valid][m] + pix[m]]
+        if len(pix) > 0:
+            counts = numpy.bincount(pix, minlength=N)
+            r = numpy.bincount(pix, weights=(c >> 16) & 0xFF, minlength=N)
+            g = numpy.bincount(pix, weights=(c >> 8) & 0xFF, minlength=N)
+            b = numpy.bincount(pix, weights=c & 0xFF, minlength=N)
+            touched = numpy.flatnonzero(counts)
+            ar = numpy.frombuffer(self.ar, dtype=numpy.uint32)
+            old = ar[touched].astype(numpy.int64)
+            r = numpy.minimum(((old >> 16) & 0xFF) + r[touched].astype(numpy.int64), 0xFF)
+            g = numpy.minimum(((old >> 8) & 0xFF) + g[touched].astype(numpy.int64), 0xFF)
+            b = numpy.minimum((old & 0xFF) + b[touched].astype(numpy.int64), 0xFF)
+            ar[touched] = ((r << 16) | (g << 8) | b).astype(numpy.uint32)
+            self.markDirty(int(touched[0]), int(touched[-1]) + 1)
+        for p in direct:
+            self._drawPulse(p, p.index)
+
+    ## @brief Returns the colour map table shared by pulses with the same colour map, or None if the pulse's colour map has to be called directly.
+    #
+    # \param p A pulse object
+
+    def _pulseColourTable(self, p):
+        key = p._tableKey
+        if key is None:
+            return None
+        if self._pulseTables is None:
+            self._pulseTables = {}
+        lut = self._pulseTables.get(key)
+        if lut is None:
+            lut = p.colourMapTable(0, self.numLEDs, 1, 0, self.numLEDs)
+            if len(self._pulseTables) >= 8:
+                self._pulseTables = {}
+            self._pulseTables[key] = lut
+        return lut
+
+    ## @brief Discards the colour map tables shared by pulses. Call this after changing state a custom pulse colour map depends on.
+
+    def invalidatePulseColourMaps(self):
+        self._pulseTables = None
+        self._pulseLayout = None
+
+    ## @brief Awaitable pulse animation frame. Updates and draws all pulses then awaits pixelsShowAsync().
+    #
+    # \param clear If True the internal buffer is blanked before the pulses are drawn, as done in pulseDemo().
+
+    async def updatePulsesAsync(self, clear = True):
+        if clear == True:
+            self.pixelsFill(0)
+        self.updatePulses()
+        await self.pixelsShowAsync()
+
+    ## @brief Animates all pulses with updatePulsesAsync() until every pulse has left the display.
+    #
+    # \param clear If True the internal buffer is blanked before each frame is drawn.
+
+    async def runPulsesAsync(self, clear = True):
+        while len(self.pulses) > 0:
+            await self.updatePulsesAsync(clear)
        
 
     ## @brief One dimensional graph ofject for drawing a graph bar on a GlowBit Stick display
@@ -1147,7 +3764,11 @@ class stick(glowbit):
     def updateGraph1D(self, graph, value):
         i = round(graph.m*value + graph.offset)
         m = graph.colourMap
-        for idx in range(graph.minIndex, i+1):
+        lut = graph.colourMapTable(graph.minIndex, graph.maxIndex-graph.minIndex+1, 1, graph.minIndex, graph.maxIndex)
+        for idx in range(graph.minIndex, min(i, graph.maxIndex)+1):
+            self.pixelSet(idx, lut[idx - graph.minIndex])
+        # Values above maxValue run past the end of the table
+        for idx in range(graph.maxIndex+1, i+1):
             self.pixelSet(idx, m(idx, graph.minIndex, graph.maxIndex))
         for idx in range(i+1, graph.maxIndex+1):
             self.pixelSet(idx, 0)
@@ -1313,6 +3934,7 @@ class triangle(glowbit):
         if _SYSNAME == 'rp2':
             self.sm = rp2.StateMachine(sm, self._ws2812, freq=8_000_000, sideset_base=Pin(pin))
             self.sm.active(1)
+            self._smId = sm
             self.pixelsShow = self._pixelsShowPico
             self.ticks_ms = time.ticks_ms
 
@@ -1334,10 +3956,7 @@ class triangle(glowbit):
         else:
             self.rateLimit = 100
         
-        if brightness <= 1.0 and isinstance(brightness, float):
-            self.brightness = int(brightness*255)
-        else:
-            self.brightness = int(brightness)
+        self.updateBrightness(brightness)
         
         self.pixelsFill(0)
         self.lastFrame_ms = self.ticks_ms()
@@ -1352,6 +3971,7 @@ class triangle(glowbit):
         addr = self.LEDsPerTri*tri
         for i in range(addr, addr+self.LEDsPerTri):
             self.ar[i] = colour
+        self.markDirty(addr, addr+self.LEDsPerTri)
 
     ## @brief Displays a simple demo pattern
 
@@ -1387,6 +4007,7 @@ class matrix4x4(glowbitMatrix):
         if _SYSNAME == 'rp2':
             self.sm = rp2.StateMachine(sm, self._ws2812, freq=8_000_000, sideset_base=Pin(pin))
             self.sm.active(1)
+            self._smId = sm
             self.pixelsShow = self._pixelsShowPico
             self.ticks_ms = time.ticks_ms
 
@@ -1410,10 +4031,7 @@ class matrix4x4(glowbitMatrix):
         self.lastFrame_ms = self.ticks_ms()
         self.scrollingText = False # Only required because the self.pixelsShow() function is shared with the 8x8
         
-        if brightness <= 1.0 and isinstance(brightness, float):
-            self.brightness = int(brightness*255)
-        else:
-            self.brightness = int(brightness)
+        self.updateBrightness(brightness)
 
         if callable(mapFunction) is True:
             self.remap = mapFunction
@@ -1428,6 +4046,7 @@ class matrix4x4(glowbitMatrix):
         # Blank display
         self.pixelsFill(0)
         self.pixelsShow()
+        self.invalidateFrame()
         self.pixelsShow() # On fresh power-on this is needed twice. Why?!?!
 
     ## @brief Maps an (x,y) coordinate on a 4 row, Nx4 column, tiled GlowBit Matrix 4x4 array to an array index for the internal buffer.
@@ -1468,7 +4087,7 @@ class matrix4x4(glowbitMatrix):
 #
 
 class matrix8x8(glowbitMatrix):
-    
+
     ## @brief Initialisation routine for GlowBit stick modules and tiled arrays thereof.
     # 
     # \param tileRows The number of tiled GlowBit Matrix 8x8 module rows.
@@ -1495,6 +4114,7 @@ class matrix8x8(glowbitMatrix):
         if _SYSNAME == 'rp2':
             self.sm = rp2.StateMachine(sm, self._ws2812, freq=8_000_000, sideset_base=Pin(pin))
             self.sm.active(1)
+            self._smId = sm
             self.pixelsShow = self._pixelsShowPico
             self.ticks_ms = time.ticks_ms
 
@@ -1507,10 +4127,7 @@ class matrix8x8(glowbitMatrix):
         self.ar = array.array("I", [0 for _ in range(self.numLEDs)])
         self.dimmer_ar = array.array("I", [0 for _ in range(self.numLEDs)])
         
-        if brightness <= 1.0 and isinstance(brightness, float):
-            self.brightness = int(brightness*255)
-        else:
-            self.brightness = int(brightness)
+        self.updateBrightness(brightness)
         
         # Set to True while a scrolling text object is available to be drawn.
         self.scrollingText = False
@@ -1534,37 +4151,23 @@ class matrix8x8(glowbitMatrix):
             
         # Blank display
         self.blankDisplay()
+        self.invalidateFrame()
         self.blankDisplay()
 
-    ## @brief Prints a string of text to a tiled GlowBit Matrix 8x8 display, automatically wrapping to new lines as required. Each character occupies an 8x8 pixel area.
-    #
-    # Characters which do not fit on the display are truncated.
-    #
-    # \param string The string to print to the display.
-    # \param x The x coordinate of the upper left corner of the first character
-    # \param y The y coordinate of the upper left corner of the first character
-    # \param colour A 32-bit GlowBit colour value. All pixels in every character will be drawn in this colour.
-    def printTextWrap(self, string, x = 0, y = 0, colour = 0xFFFFFF):
-        Px = x
-        Py = y
-        for char in string:
-            if Py < self.numLEDsY - 7:
-                self.drawChar(char, Px, Py, colour)
-            Px += 8
-            if Px + 1 >= self.numLEDsX:
-                Py += 8
-                if x < 0:
-                    Px = 0
-                else:
-                    Px = x
-
     class _textScroll():
-        def __init__(self, string, y = 0, x = 0, colour = 0xFFFFFF, bgColour = 0):
+        def __init__(self, string, y = 0, x = 0, colour = 0xFFFFFF, bgColour = 0, speed = None, font = None, proportional = False):
             self.x = x
             self.y = y
             self.colour = colour
             self.bgColour = bgColour
             self.string = string
+            font = getFont(font)
+            self.height = font.height
+            self.columns = font.render(string, proportional)
+            # Scroll speed in 1/65536 pixels per millisecond; None steps one pixel per update
+            self.speed = None if speed is None else int(speed*65536/1000)
+            self.subPixel = 0
+            self.lastStep_ms = None
     
     ## @brief Adds a line of scrolling text to the display.
     #
@@ -1574,6 +4177,8 @@ class matrix8x8(glowbitMatrix):
     #
     # If non-blockig this method will return quickly, allowing subsequent calls to updateTextScroll() to control the rate of scrolling text animation. The text will scroll to the left one pixel with each call to updateTextScroll().
     #
+    # If speed is given the text instead scrolls at that many pixels per second, measured with ticks_ms() and independent of how often updateTextScroll() is called. This lets the display run at a high frame rate for other animations while each line of text scrolls at its own readable pace.
+    #
     # The update prameter is provided for convinience; if it is set to True a call to updateTextScroll() will automatically call pixelsShow(). Setting update to False allows the text scroll to be synchronised with other drawing updates.
     #
     # \param string The string of text to scroll across the display
@@ -1583,9 +4188,12 @@ class matrix8x8(glowbitMatrix):
     # \param bgColour The colour of the background (ie: all pixels in the 8-row high area the text is drawn to which aren't part of a character). A 32-bit GlowBit colour value.
     # \param update Passing update = True causes updateTextScroll() to call pixelsShow(). Otherwise pixelsShow() must be called manually, allowing synchronisation of scrolling text with other animated features.
     # \param blocking Passing blocking = True will draw the scrolling text to the screen immediately and this method will not return until the text has scrolled off the display.
+    # \param speed The scrolling speed in pixels per second. The default, None, scrolls one pixel per call to updateTextScroll().
+    # \param font The font of the text: a bitmapFont, the name of a registered font (eg: "3x5") or None for the 8x8 petme128 font. The background band is as high as the font.
+    # \param proportional If True the text is packed tightly, each character only taking up the width of its lit columns plus a gap. The text is removed once its measured width has scrolled past.
 
-    def addTextScroll(self, string, y = 0, x = 0, colour = 0xFFFFFF, bgColour = 0x000000, update=False, blocking=False):
-        self.scrollingTextList.append(self._textScroll(string, y, -self.numLEDsX-x, colour, bgColour))
+    def addTextScroll(self, string, y = 0, x = 0, colour = 0xFFFFFF, bgColour = 0x000000, update=False, blocking=False, speed = None, font = None, proportional = False):
+        self.scrollingTextList.append(self._textScroll(string, y, -self.numLEDsX-x, colour, bgColour, speed, font, proportional))
         self.updateText = update
         # Set to True if scrolling text exists to be drawn.
         self.scrollingText = True
@@ -1599,23 +4207,61 @@ class matrix8x8(glowbitMatrix):
     # addTextScroll() must be called at least once for scrolling text to be drawn to the display.
 
     def updateTextScroll(self):
-        for textLine in self.scrollingTextList:
-            x = 0
-            self.drawRectangleFill(0,textLine.y,self.numLEDsX, textLine.y+7, textLine.bgColour)
-            for c in textLine.string:
-                self.drawChar(c, -textLine.x+8*x, textLine.y, textLine.colour)
-                x += 1
-            textLine.x += 1
-                            
-        for textLine in reversed(self.scrollingTextList):
-            if textLine.x == 8*len(textLine.string)+1:
-                self.scrollingTextList.remove(textLine)
-        
+        self._stepTextScroll()
         if self.updateText == True:
             self.pixelsShow()
         if len(self.scrollingTextList) == 0:
             self.scrollingText = False
 
+    ## @brief Awaitable version of updateTextScroll().
+    #
+    # If the scrolling text was added with update = True this coroutine awaits pixelsShowAsync() instead of blocking in pixelsShow().
+
+    async def updateTextScrollAsync(self):
+        self._stepTextScroll()
+        if self.updateText == True:
+            await self.pixelsShowAsync()
+        if len(self.scrollingTextList) == 0:
+            self.scrollingText = False
+
+    ## @brief Awaitable version of addTextScroll(string, blocking = True).
+    #
+    # Adds a line of scrolling text and returns once all scrolling text has left the display. Each frame is drawn with pixelsShowAsync() so the event loop keeps running while the text scrolls.
+    #
+    # \param string The string of text to scroll across the display
+    # \param y The y coordinate of the top edge of the text
+    # \param x The initial location of the text relative to the right edge of the display. See addTextScroll().
+    # \param colour The colour of the scrolling text characters. A 32-bit GlowBit colour value
+    # \param bgColour The colour of the background. A 32-bit GlowBit colour value.
+
+    async def addTextScrollAsync(self, string, y = 0, x = 0, colour = 0xFFFFFF, bgColour = 0x000000, speed = None, font = None, proportional = False):
+        self.addTextScroll(string, y, x, colour, bgColour, update = True, speed = speed, font = font, proportional = proportional)
+        while self.scrollingText:
+            await self.updateTextScrollAsync()
+
+    def _stepTextScroll(self):
+        now = self.ticks_ms()
+        for textLine in self.scrollingTextList:
+            self.drawRectangleFill(0,textLine.y,self.numLEDsX, textLine.y+textLine.height-1, textLine.bgColour)
+            self._drawColumns(textLine.columns, textLine.x, textLine.y, textLine.colour)
+            if textLine.speed is None:
+                textLine.x += 1
+            else:
+                # Fixed-point position: whole pixels move the text, the remainder carries to the next step. Only whole milliseconds are consumed, so a fractional clock (Linux) or steps under 1 ms carry over too.
+                if textLine.lastStep_ms is None:
+                    textLine.lastStep_ms = now
+                else:
+                    elapsed = int(now - textLine.lastStep_ms)
+                    if elapsed > 0:
+                        textLine.subPixel += elapsed*textLine.speed
+                        textLine.x += textLine.subPixel >> 16
+                        textLine.subPixel &= 0xFFFF
+                        textLine.lastStep_ms += elapsed
+                            
+        for textLine in reversed(self.scrollingTextList):
+            if textLine.x >= len(textLine.columns)+1:
+                self.scrollingTextList.remove(textLine)
+
     ## @brief Maps an (x,y) coordinate on a tiled GlowBit Matrix 8x8 array to an internal buffer array index.
     #
     # It is recommended to use pixelSetXY() (and variants) instead of this function.
@@ -1645,46 +4291,37 @@ class matrix8x8(glowbitMatrix):
         #return (ModulesBefore * 64) + (8*(y%8) + x%8)
         #return (ModulesBefore * 64) + (8*(y-8*(y//8)) + x-8*(x//8))
 
-    ## @brief Draw a single character to the display
-    #
-    # For increased performance on Micropython boards this method uses the Micropython Viper code emitter so all arguments are necessary.
+    ## @brief Adds colour, with saturation, to the pixels lit by the visible window of a pre-rendered column strip.
     #
-    # See also: addTextScroll() / updateTextScroll() for built-in scrolling text and printTextWrap() for printing static text with automatic line feeds.
+    # Display column X shows strip column X + offset, so only the columns on screen are visited.
     #
-    # \param char A single character string. This character will be drawn to the internal buffer.
-    # \param Px The x coordinate of the upper left corner of the character. Characters occupy an 8x8 pixel area.
-    # \param Py The y coordinate of the upper left corner of the character. Characters occupy an 8x8 pixel area.
+    # \param columns A column strip from bitmapFont.render()
+    # \param offset The strip column shown at x = 0
+    # \param Py The y coordinate of the strip's top row
     # \param colour A 32-bit GlowBit colour value
 
-    @micropython.viper
-    def drawChar(self, char, Px: int, Py: int, colour: int):
-        if Px < -7 or Px > int(self.numLEDsX):
-            return
-        ar = ptr32(self.ar)
-        remap = self.remap
-        x = Px
-        y = Py
-        charIdx = (int(ord(char))-32)*8
-        N = int(self.numLEDs)
-        maxCol = int(min(8, int(self.numLEDsX)-Px))
-        if x < 0:
-            minCol = -1*x
-            x = 0
-        else:
-            minCol = 0
-        tileCols = int(self.tileCols)
-        for col in range(minCol, maxCol):
-            dat = int(petme128[charIdx + col])
-            ar[int(remap(x,y))] += ((dat)&1)*(colour)
-            ar[int(remap(x,y+1))] += ((dat>>1)&1)*colour
-            ar[int(remap(x,y+2))] += ((dat>>2)&1)*colour
-            ar[int(remap(x,y+3))] += ((dat>>3)&1)*colour
-            ar[int(remap(x,y+4))] += ((dat>>4)&1)*colour
-            ar[int(remap(x,y+5))] += ((dat>>5)&1)*colour
-            ar[int(remap(x,y+6))] += ((dat>>6)&1)*colour
-            ar[int(remap(x,y+7))] += ((dat>>7)&1)*colour
-            x += 1
-    
+    def _drawColumns(self, columns, offset, Py, colour):
+        W = self.numLEDsX
+        H = self.numLEDsY
+        ar = self.ar
+        table = self._remapTable
+        lo = self._DIRTY_MAX
+        hi = 0
+        for X in range(max(0, -offset), min(W, len(columns) - offset)):
+            bits = columns[X + offset]
+            y = Py
+            while bits:
+                if bits & 1 and y >= 0 and y < H:
+                    i = table[y*W + X]
+                    ar[i] = _saturatingAdd(ar[i], colour)
+                    if i < lo:
+                        lo = i
+                    if i >= hi:
+                        hi = i + 1
+                bits >>= 1
+                y += 1
+        self.markDirty(lo, hi)
+
     ## @brief Changes the 8x8 matrix display's update rate in units of "characters of scrolling text per second".
     #
     # For example, a value of 2 would scroll 2 charcters per second; leaving each character at least partly visible for 0.5 seconds.
@@ -18,7 +18,9 @@ setup (
         ],        
     py_modules = [
         "glowbit",
-        "petme128"
+        "petme128",
+        "font3x5",
+        "font5x7"
         ],
     package_dir = {'': 'glowbit'},
 )
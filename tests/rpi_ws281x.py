@@ -0,0 +1,86 @@
+"""Recording stand-in for the rpi_ws281x module, used by the tests.
+
+PixelStrip keeps its LED data in a ctypes buffer, like the real channel,
+and counts every call which writes to it or shows it. Setting
+exposeBuffer or exposePixels to False on a strip hides the channel
+buffer or getPixels(), so each of the strip writers in glowbit can be
+exercised.
+"""
+
+import ctypes
+
+
+class _Channel:
+    def __init__(self, num):
+        self.leds = (ctypes.c_uint32 * num)()
+        self.exposeBuffer = True
+
+
+def ws2811_channel_t_leds_get(channel):
+    if not channel.exposeBuffer:
+        return 0
+    return ctypes.addressof(channel.leds)
+
+
+class _LED_Data:
+    def __init__(self, strip):
+        self.strip = strip
+
+    def __len__(self):
+        return len(self.strip._channel.leds)
+
+    def __getitem__(self, pos):
+        return self.strip._channel.leds[pos]
+
+    def __setitem__(self, pos, value):
+        self.strip.sliceWrites += 1
+        leds = self.strip._channel.leds
+        if isinstance(pos, slice):
+            for j, i in enumerate(range(*pos.indices(len(leds)))):
+                leds[i] = value[j]
+        else:
+            leds[pos] = value
+
+
+class PixelStrip:
+    def __init__(self, num, pin, freq_hz=800000, dma=10, invert=False, brightness=255, channel=0, strip_type=None, gamma=None):
+        self.pin = pin
+        self.dma = dma
+        self._channel = _Channel(num)
+        self._led_data = _LED_Data(self)
+        self.exposePixels = True
+        self.pixelWrites = 0
+        self.sliceWrites = 0
+        self.shows = 0
+
+    @property
+    def exposeBuffer(self):
+        return self._channel.exposeBuffer
+
+    @exposeBuffer.setter
+    def exposeBuffer(self, value):
+        self._channel.exposeBuffer = value
+
+    def begin(self):
+        pass
+
+    def show(self):
+        self.shows += 1
+
+    def numPixels(self):
+        return len(self._channel.leds)
+
+    def setPixelColor(self, n, color):
+        self.pixelWrites += 1
+        self._channel.leds[n] = color
+
+    def getPixelColor(self, n):
+        return self._channel.leds[n]
+
+    def ledData(self):
+        return list(self._channel.leds)
+
+    def getPixels(self):
+        if not self.exposePixels:
+            raise AttributeError("getPixels")
+        return self._led_data
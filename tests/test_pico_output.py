@@ -0,0 +1,73 @@
+"""The "Put", "Buffer" and "DMA" Pico output modes must send the same words."""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+
+import glowbit
+
+MODES = ("Put", "Buffer", "DMA")
+
+
+def scaled(c, brightness):
+    r = ((c >> 16) & 0xFF) * brightness >> 8
+    g = ((c >> 8) & 0xFF) * brightness >> 8
+    b = (c & 0xFF) * brightness >> 8
+    return (r << 16) | (g << 8) | b
+
+
+# The word the state machine receives: GRB in the top 24 bits
+def word(c, brightness):
+    c = scaled(c, brightness)
+    return ((c & 0xFF00) << 16) | (c & 0xFF0000) | ((c & 0xFF) << 8)
+
+
+class PicoOutputTest(unittest.TestCase):
+
+    def makeStick(self, mode):
+        s = glowbit.stick(numLEDs = 40, brightness = 77, rateLimitFPS = 100000)
+        sm = glowbit.simulatedStateMachine()
+        s.attachStateMachine(sm)
+        s.setPicoOutput(mode)
+        return s, sm
+
+    def test_modes_match(self):
+        rng = random.Random(2)
+        frame = [rng.randint(0, 0xFFFFFF) for _ in range(40)]
+        expected = [word(c, 77) for c in frame]
+        for mode in MODES:
+            s, sm = self.makeStick(mode)
+            s.ar[:] = glowbit.array.array("I", frame)
+            s.pixelsShow()
+            self.assertEqual(list(sm.words), expected, mode)
+            self.assertEqual(list(sm.colours()), [scaled(c, 77) for c in frame], mode)
+
+    def test_modes_match_over_frames(self):
+        results = []
+        for mode in MODES:
+            s, sm = self.makeStick(mode)
+            s.dirtyTracking = True
+            s.pixelsFill(0x102030)
+            s.pixelsShow()
+            s.pixelSet(5, 0xFF8000)
+            s.pixelsShow()
+            s.updateBrightness(200)
+            s.pixelSet(30, 0x00FFFF)
+            s.pixelsShow()
+            frames = [list(sm.words[i:i + 40]) for i in range(0, len(sm.words), 40)]
+            self.assertEqual(len(frames), 3, mode)
+            results.append(frames)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        last = [word(0x102030, 200)]*40
+        last[5] = word(0xFF8000, 200)
+        last[30] = word(0x00FFFF, 200)
+        self.assertEqual(results[0][2], last)
+
+
+if __name__ == "__main__":
+    unittest.main()
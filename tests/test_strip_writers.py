@@ -0,0 +1,69 @@
+"""The three Raspberry Pi strip writers must leave the same LED data."""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+
+import glowbit
+
+
+def scaled(c, brightness):
+    r = ((c >> 16) & 0xFF) * brightness >> 8
+    g = ((c >> 8) & 0xFF) * brightness >> 8
+    b = (c & 0xFF) * brightness >> 8
+    return (r << 16) | (g << 8) | b
+
+
+class StripWriterTest(unittest.TestCase):
+
+    def makeStick(self, exposeBuffer, exposePixels):
+        s = glowbit.stick(numLEDs = 40, brightness = 77, rateLimitFPS = -1)
+        # A new strip, so the writer is chosen again with the hidden interfaces
+        strip = glowbit.ws.PixelStrip(40, 18)
+        strip.exposeBuffer = exposeBuffer
+        strip.exposePixels = exposePixels
+        s.strip = strip
+        return s
+
+    def sticks(self):
+        # memmove into the channel buffer, getPixels() slice, setPixelColor() loop
+        return [self.makeStick(True, True), self.makeStick(False, True), self.makeStick(False, False)]
+
+    def test_paths_match(self):
+        sticks = self.sticks()
+        rng = random.Random(1)
+        frame = [rng.randint(0, 0xFFFFFF) for _ in range(40)]
+        for s in sticks:
+            s.ar[:] = glowbit.array.array("I", frame)
+            s.pixelsShow()
+        expected = [scaled(c, 77) for c in frame]
+        for s in sticks:
+            self.assertEqual(s.strip.ledData(), expected)
+            self.assertEqual(s.strip.shows, 1)
+        self.assertEqual((sticks[0].strip.sliceWrites, sticks[0].strip.pixelWrites), (0, 0))
+        self.assertEqual((sticks[1].strip.sliceWrites, sticks[1].strip.pixelWrites), (1, 0))
+        self.assertEqual((sticks[2].strip.sliceWrites, sticks[2].strip.pixelWrites), (0, 40))
+
+    def test_dirty_range_paths_match(self):
+        sticks = self.sticks()
+        for s in sticks:
+            s.dirtyTracking = True
+            s.pixelsFill(0x102030)
+            s.pixelsShow()
+            s.pixelSet(7, 0xFF8000)
+            s.pixelSet(9, 0x00FFFF)
+            s.pixelsShow()
+        expected = [scaled(0x102030, 77)]*40
+        expected[7] = scaled(0xFF8000, 77)
+        expected[9] = scaled(0x00FFFF, 77)
+        for s in sticks:
+            self.assertEqual(s.strip.ledData(), expected)
+        self.assertEqual(sticks[2].strip.pixelWrites, 40 + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Scrolling text with a speed must move at that speed however often it is updated."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "glowbit"))
+
+import glowbit
+
+
+class TextScrollSpeedTest(unittest.TestCase):
+
+    def distance(self, speed, step_ms, duration_ms):
+        m = glowbit.matrix8x8(rateLimitFPS = 100000)
+        clock = [1000.0]
+        m.ticks_ms = lambda: clock[0]
+        m.addTextScroll("A long enough line of text to keep scrolling", speed = speed)
+        line = m.scrollingTextList[0]
+        m.updateTextScroll()
+        start = line.x
+        for _ in range(int(round(duration_ms / step_ms))):
+            clock[0] += step_ms
+            m.updateTextScroll()
+        return line.x - start
+
+    def test_sub_millisecond_updates(self):
+        # 0.25 ms per update, as with a very high frame rate on the fractional Linux clock
+        self.assertIn(self.distance(50, 0.25, 1000), (49, 50))
+
+    def test_fractional_frame_interval(self):
+        # 60 FPS: 16.67 ms per update
+        self.assertIn(self.distance(50, 1000/60, 2000), (99, 100))
+
+    def test_whole_millisecond_updates(self):
+        self.assertIn(self.distance(20, 10, 1000), (19, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()